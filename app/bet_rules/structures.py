@@ -1,3 +1,4 @@
+from collections.abc import Callable
 from enum import Enum
 
 from pydantic import BaseModel, Field, computed_field
@@ -65,6 +66,18 @@ class MatchData(BaseModel):
     status: str
 
 
+# Whether a team's (scored, conceded) result, None for an unfinished match,
+# extends each type of streak
+STREAK_CONDITIONS: dict[str, Callable[[tuple[int, int] | None], bool]] = {
+    'win': lambda result: result is not None and result[0] > result[1],
+    'loss': lambda result: result is not None and result[0] < result[1],
+    'draw': lambda result: result is not None and result[0] == result[1],
+    'no_win': lambda result: result is not None and result[0] <= result[1],
+    'no_goals': lambda result: result is not None and result[0] == 0,
+    'goals': lambda result: result is None or result[0] != 0,
+}
+
+
 class TeamAnalysis(BaseModel):
     """Comprehensive team performance analysis"""
 
@@ -167,29 +180,20 @@ class TeamAnalysis(BaseModel):
         if not recent_matches:
             return analysis
 
+        # Goals scored and conceded by the team, None for unfinished matches
+        results = [cls._team_score(match, team) for match in recent_matches]
+
         # Calculate consecutive streaks
-        analysis.consecutive_wins = cls._calculate_consecutive_streak(
-            recent_matches, team, 'win'
-        )
-        analysis.consecutive_losses = cls._calculate_consecutive_streak(
-            recent_matches, team, 'loss'
-        )
-        analysis.consecutive_draws = cls._calculate_consecutive_streak(
-            recent_matches, team, 'draw'
-        )
-        analysis.consecutive_no_wins = cls._calculate_consecutive_streak(
-            recent_matches, team, 'no_win'
-        )
-        analysis.consecutive_no_goals = cls._calculate_consecutive_streak(
-            recent_matches, team, 'no_goals'
-        )
-        analysis.consecutive_goals = cls._calculate_consecutive_streak(
-            recent_matches, team, 'goals'
-        )
+        analysis.consecutive_wins = cls._streak_from_scores(results, 'win')
+        analysis.consecutive_losses = cls._streak_from_scores(results, 'loss')
+        analysis.consecutive_draws = cls._streak_from_scores(results, 'draw')
+        analysis.consecutive_no_wins = cls._streak_from_scores(results, 'no_win')
+        analysis.consecutive_no_goals = cls._streak_from_scores(results, 'no_goals')
+        analysis.consecutive_goals = cls._streak_from_scores(results, 'goals')
 
         # Calculate match results
-        wins = sum(1 for match in recent_matches if cls._team_won(match, team))
-        draws = sum(1 for match in recent_matches if cls._team_drew(match, team))
+        wins = sum(map(STREAK_CONDITIONS['win'], results))
+        draws = sum(map(STREAK_CONDITIONS['draw'], results))
         losses = len(recent_matches) - wins - draws
 
         analysis.wins = wins
@@ -199,76 +203,62 @@ class TeamAnalysis(BaseModel):
         return analysis
 
     @staticmethod
-    def _calculate_consecutive_streak(
-        matches: list[MatchData], team: TeamData, streak_type: str
+    def _team_score(match: MatchData, team: TeamData) -> tuple[int, int] | None:
+        """Get (scored, conceded) for the team, or None if the match is unfinished"""
+        if match.home_score is None or match.away_score is None:
+            return None
+
+        if match.home_team_id == team.id:
+            return match.home_score, match.away_score
+        else:
+            return match.away_score, match.home_score
+
+    @staticmethod
+    def _streak_from_scores(
+        results: list[tuple[int, int] | None], streak_type: str
     ) -> int:
-        """Calculate consecutive streak for a specific type (win, loss, draw, no_goals, goals)"""
+        """Count leading results that extend a streak of the given type"""
+        condition = STREAK_CONDITIONS.get(streak_type)
+        if condition is None:
+            return 0
+
         streak = 0
 
-        for match in matches:
-            if streak_type == 'win' and TeamAnalysis._team_won(match, team):
-                streak += 1
-            elif streak_type == 'loss' and TeamAnalysis._team_lost(match, team):
-                streak += 1
-            elif streak_type == 'draw' and TeamAnalysis._team_drew(match, team):
-                streak += 1
-            elif streak_type == 'no_win' and not TeamAnalysis._team_won(match, team):
-                # No win = draw or loss (but match must be finished)
-                if match.home_score is not None and match.away_score is not None:
-                    streak += 1
-                else:
-                    break
-            elif streak_type == 'no_goals' and TeamAnalysis._team_no_goals(match, team):
-                streak += 1
-            elif streak_type == 'goals' and not TeamAnalysis._team_no_goals(
-                match, team
-            ):
-                streak += 1
-            else:
+        for result in results:
+            if not condition(result):
                 break
+            streak += 1
 
         return streak
 
+    @staticmethod
+    def _calculate_consecutive_streak(
+        matches: list[MatchData], team: TeamData, streak_type: str
+    ) -> int:
+        """Calculate consecutive streak for a specific type (win, loss, draw, no_goals, goals)"""
+        return TeamAnalysis._streak_from_scores(
+            [TeamAnalysis._team_score(match, team) for match in matches], streak_type
+        )
+
     @staticmethod
     def _team_won(match: MatchData, team: TeamData) -> bool:
         """Check if team won the match"""
-        if match.home_score is None or match.away_score is None:
-            return False
-
-        if match.home_team_id == team.id:
-            return match.home_score > match.away_score
-        else:
-            return match.away_score > match.home_score
+        return STREAK_CONDITIONS['win'](TeamAnalysis._team_score(match, team))
 
     @staticmethod
     def _team_lost(match: MatchData, team: TeamData) -> bool:
         """Check if team lost the match"""
-        if match.home_score is None or match.away_score is None:
-            return False
-
-        if match.home_team_id == team.id:
-            return match.home_score < match.away_score
-        else:
-            return match.away_score < match.home_score
+        return STREAK_CONDITIONS['loss'](TeamAnalysis._team_score(match, team))
 
     @staticmethod
     def _team_drew(match: MatchData, team: TeamData) -> bool:
         """Check if team drew the match"""
-        if match.home_score is None or match.away_score is None:
-            return False
-
-        return match.home_score == match.away_score
+        return STREAK_CONDITIONS['draw'](TeamAnalysis._team_score(match, team))
 
     @staticmethod
     def _team_no_goals(match: MatchData, team: TeamData) -> bool:
         """Check if team scored no goals in the match"""
-        if match.home_score is None or match.away_score is None:
-            return False
-
-        if match.home_team_id == team.id:
-            return match.home_score == 0
-        else:
-            return match.away_score == 0
+        return STREAK_CONDITIONS['no_goals'](TeamAnalysis._team_score(match, team))
 
 
 class MatchSummary(BaseModel):
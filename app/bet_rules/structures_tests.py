@@ -244,6 +244,65 @@ def test_analyze_team_performance_with_single_match(mock_teams):
     assert analysis.consecutive_goals == 1
 
 
+def test_analyze_team_performance_streaks_with_unfinished_matches(mock_teams):
+    """Test streaks and results when recent matches include unfinished ones"""
+    home_team, away_team = mock_teams
+
+    unfinished = MatchData(
+        id=9, home_team_id=home_team.id, away_team_id=away_team.id, status='scheduled'
+    )
+    # Most recent first: [loss (away), loss, draw, win]
+    sequences = [
+        (
+            [
+                create_match_data(away_team.id, home_team.id, 2, 0),
+                create_match_data(home_team.id, away_team.id, 0, 1),
+                create_match_data(home_team.id, away_team.id, 1, 1),
+                create_match_data(home_team.id, away_team.id, 3, 0),
+            ],
+            {
+                'consecutive_wins': 0,
+                'consecutive_losses': 2,
+                'consecutive_draws': 0,
+                'consecutive_no_wins': 3,
+                'consecutive_no_goals': 2,
+                'consecutive_goals': 0,
+                'wins': 1,
+                'draws': 1,
+                'losses': 2,
+            },
+        ),
+        # An unfinished match ends every streak except the one with goals
+        (
+            [unfinished, create_match_data(home_team.id, away_team.id, 2, 1)],
+            {
+                'consecutive_wins': 0,
+                'consecutive_losses': 0,
+                'consecutive_draws': 0,
+                'consecutive_no_wins': 0,
+                'consecutive_no_goals': 0,
+                'consecutive_goals': 2,
+                'wins': 1,
+                'draws': 0,
+            },
+        ),
+        (
+            [create_match_data(home_team.id, away_team.id, 2, 1), unfinished],
+            {
+                'consecutive_wins': 1,
+                'consecutive_no_wins': 0,
+                'consecutive_goals': 2,
+                'wins': 1,
+            },
+        ),
+    ]
+
+    for matches, expected in sequences:
+        analysis = TeamAnalysis.analyze_team_performance(home_team, matches)
+        for field, value in expected.items():
+            assert getattr(analysis, field) == value, field
+
+
 def test_team_won_lost_drew(mock_teams):
     """Test team result checking methods"""
     home_team, away_team = mock_teams
@@ -109,6 +109,81 @@ class BettingOpportunityRepository(BaseRepository[BettingOpportunity]):
         )
         return record
 
+    async def save_opportunities(
+        self, opportunities: list[Bet]
+    ) -> list[BettingOpportunity]:
+        """Save a batch of betting opportunities with a single commit.
+
+        Duplicates of pending opportunities, both already stored and within the
+        batch itself, are skipped like in ``save_opportunity``.
+        """
+        if not opportunities:
+            return []
+
+        match_ids = {opp.match_id for opp in opportunities if opp.match_id}
+        existing: dict[tuple[int, str], BettingOpportunity] = {}
+        if match_ids:
+            result = await self.session.execute(
+                select(BettingOpportunity).where(
+                    and_(
+                        BettingOpportunity.match_id.in_(match_ids),
+                        BettingOpportunity.rule_slug.in_(
+                            {opp.slug for opp in opportunities}
+                        ),
+                        BettingOpportunity.outcome == BetOutcome.UNKNOWN.value,
+                    )
+                )
+            )
+            existing = {
+                (record.match_id, record.rule_slug): record
+                for record in result.scalars()
+            }
+
+        records = []
+        created = []
+        for opportunity in opportunities:
+            key = (opportunity.match_id, opportunity.slug)
+            if opportunity.match_id and key in existing:
+                logger.debug(
+                    'Opportunity already exists',
+                    match_id=opportunity.match_id,
+                    rule=opportunity.slug,
+                )
+                records.append(existing[key])
+                continue
+
+            details = opportunity.details.copy()
+            details['team_analyzed'] = opportunity.team_analyzed
+            record = BettingOpportunity(
+                match_id=opportunity.match_id,
+                rule_slug=opportunity.slug,
+                confidence_score=opportunity.confidence,
+                details=json.dumps(details),
+                outcome=BetOutcome.UNKNOWN.value,
+                created_at=datetime.now(),
+            )
+            if opportunity.match_id:
+                existing[key] = record
+            records.append(record)
+            created.append(record)
+
+        # Insert under a savepoint, so a failed batch only undoes its own rows
+        # and objects the caller loaded in this session stay usable
+        async with self.session.begin_nested():
+            self.session.add_all(created)
+        try:
+            await self.session.commit()
+        except Exception:
+            # Leave the session usable for the caller's next batch
+            await self.session.rollback()
+            raise
+
+        for record in created:
+            logger.info(
+                'Created new betting opportunity', id=record.id, rule=record.rule_slug
+            )
+        return records
+
     async def get_active_betting_opportunities(self) -> list[BettingOpportunity]:
         """Get active (pending) opportunities for future matches."""
         now = datetime.now()
@@ -2,8 +2,11 @@ from datetime import datetime, timedelta
 
 import pytest
 import pytest_asyncio
+from sqlalchemy.exc import IntegrityError
 from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 
+from app.bet_rules.bet_rules import Bet, BettingOpportunity
+from app.bet_rules.structures import LeagueData, MatchSummary, TeamData
 from app.db.repositories.betting_opportunity_repository import (
     BettingOpportunityRepository,
 )
@@ -52,6 +55,60 @@ async def _create_match(
     return await match_repo.save_match(data)
 
 
+def _bet(match_id: int, slug: str) -> Bet:
+    return Bet(
+        match=MatchSummary(
+            match_id=match_id,
+            home_team_data=TeamData(id=1, name='Home'),
+            away_team_data=TeamData(id=2, name='Away'),
+            league=LeagueData(id=1, name='Test League', teams_count=20),
+            country='Country',
+        ),
+        opportunity=BettingOpportunity(
+            slug=slug, confidence=0.7, team_analyzed='Home', details={'k': 'v'}
+        ),
+    )
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_and_prevent_duplicates(db_session: AsyncSession):
+    opp_repo = BettingOpportunityRepository(db_session)
+    match = await _create_match(db_session, status='scheduled', when='future')
+
+    first = await opp_repo.save_opportunities(
+        [_bet(match.id, 'consecutive_losses'), _bet(match.id, 'consecutive_losses')]
+    )
+    assert first[0].id is not None
+    assert first[0] is first[1]  # duplicate within the batch
+
+    second = await opp_repo.save_opportunities(
+        [_bet(match.id, 'consecutive_losses'), _bet(match.id, 'consecutive_draws')]
+    )
+    assert second[0].id == first[0].id  # duplicate prevented while pending
+    assert second[1].id != first[0].id
+    assert '"team_analyzed": "Home"' in second[1].details
+
+
+@pytest.mark.asyncio
+async def test_save_opportunities_recovers_after_failed_batch(
+    db_session: AsyncSession,
+):
+    opp_repo = BettingOpportunityRepository(db_session)
+    match = await _create_match(db_session, status='scheduled', when='future')
+
+    bad = _bet(match.id, 'consecutive_losses')
+    # A missing slug violates the rule_slug NOT NULL constraint on commit
+    bad.opportunity = BettingOpportunity.model_construct(
+        slug=None, confidence=0.7, team_analyzed='Home', details={}
+    )
+    with pytest.raises(IntegrityError):
+        await opp_repo.save_opportunities([bad])
+
+    # The match loaded before the failure is still usable
+    saved = await opp_repo.save_opportunities([_bet(match.id, 'consecutive_draws')])
+    assert saved[0].id is not None
+
+
 @pytest.mark.asyncio
 async def test_save_opportunity_and_prevent_duplicates(db_session: AsyncSession):
     opp_repo = BettingOpportunityRepository(db_session)
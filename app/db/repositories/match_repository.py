@@ -1,13 +1,14 @@
+from dataclasses import asdict
 from datetime import datetime
 from typing import Any
 
-from sqlalchemy import and_, func, select
+from sqlalchemy import and_, case, func, or_, select, union_all
 from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import selectinload
 import structlog
 
 from app.db.sqlalchemy_models import League, Match, Team
-from app.scraper.livesport_scraper import CommonMatchData
+from app.scraper.livesport_scraper import CommonMatchData, CommonMatchDataModel
 
 from .base_repository import BaseRepository
 
@@ -32,6 +33,9 @@ class MatchRepository(BaseRepository[Match]):
     async def save_match(self, match_data: 'CommonMatchData') -> Match:
         """Unified method to save any type of match (live, finished, scheduled)"""
         try:
+            # Scraped data is unvalidated until it reaches the database boundary
+            match_data = CommonMatchDataModel.model_validate(asdict(match_data))
+
             # Normalize country name to prevent duplicates
             normalized_country = normalize_country_name(match_data.country)
 
@@ -300,35 +304,128 @@ class MatchRepository(BaseRepository[Match]):
             )
             return []
 
-    async def get_matches_by_league_season_round(
-        self, league_id: int, season: int, round_number: int
+    async def get_recent_matches_for_teams(
+        self,
+        before_dates: dict[int, datetime],
+        season: int,
+        limit: int = 5,
+    ) -> dict[int, list[Match]]:
+        """Get several teams' most recent matches from a season in one query.
+
+        Batch form of get_team_matches_by_season_and_rounds: for every team, gets
+        the N most recent finished matches (by match_date) played before that
+        team's own date.
+
+        Args:
+            before_dates: Team ID to the date to get matches before (exclusive)
+            season: Season year
+            limit: Number of matches to return per team (default: 5)
+
+        Returns:
+            Team ID to its matches ordered by match_date descending (most recent
+            first); teams without matches map to an empty list
+        """
+        recent_matches: dict[int, list[Match]] = {
+            team_id: [] for team_id in before_dates
+        }
+        if not before_dates:
+            return recent_matches
+
+        try:
+            # One row per (match, participating team) so both sides can be ranked
+            finished = and_(Match.season == season, Match.status == 'finished')
+            team_matches = union_all(
+                select(
+                    Match.id.label('match_id'),
+                    Match.home_team_id.label('team_id'),
+                    Match.match_date.label('match_date'),
+                ).where(finished),
+                select(
+                    Match.id.label('match_id'),
+                    Match.away_team_id.label('team_id'),
+                    Match.match_date.label('match_date'),
+                ).where(finished),
+            ).subquery()
+
+            ranked = (
+                select(
+                    team_matches.c.match_id,
+                    team_matches.c.team_id,
+                    func.row_number()
+                    .over(
+                        partition_by=team_matches.c.team_id,
+                        order_by=team_matches.c.match_date.desc(),
+                    )
+                    .label('position'),
+                )
+                .where(
+                    team_matches.c.team_id.in_(before_dates),
+                    team_matches.c.match_date
+                    < case(before_dates, value=team_matches.c.team_id),
+                )
+                .subquery()
+            )
+
+            result = await self.session.execute(
+                select(ranked.c.team_id, Match)
+                .join(Match, Match.id == ranked.c.match_id)
+                .options(
+                    selectinload(Match.home_team),
+                    selectinload(Match.away_team),
+                    selectinload(Match.league),
+                )
+                .where(ranked.c.position <= limit)
+                .order_by(ranked.c.team_id, ranked.c.position)
+            )
+            for team_id, match in result.all():
+                recent_matches[team_id].append(match)
+
+            logger.debug(
+                f'Found recent matches for {len(before_dates)} teams in season {season}'
+            )
+            return recent_matches
+        except Exception as e:
+            logger.error(
+                'Error getting recent matches for teams',
+                error=str(e),
+                team_ids=list(before_dates),
+                limit=limit,
+                season=season,
+            )
+            return {team_id: [] for team_id in before_dates}
+
+    async def get_matches_by_league_season_from_round(
+        self, league_id: int, season: int, start_round: int
     ) -> list[Match]:
-        """Get matches by league, season, and round number"""
+        """Get finished matches from start_round onwards, ordered by round and date.
+
+        League teams are not loaded; pass teams_count to MatchSummary.from_match.
+        """
         try:
             result = await self.session.execute(
                 select(Match)
                 .options(
                     selectinload(Match.home_team),
                     selectinload(Match.away_team),
-                    selectinload(Match.league).selectinload(League.teams),
+                    selectinload(Match.league),
                 )
                 .where(
                     and_(
                         Match.league_id == league_id,
                         Match.season == season,
-                        Match.round == round_number,
+                        Match.round >= start_round,
                         Match.status == 'finished',
                     )
                 )
-                .order_by(Match.match_date.asc())
+                .order_by(Match.round.asc(), Match.match_date.asc())
             )
             return result.scalars().all()
         except Exception as e:
             logger.error(
-                f'Error getting matches by league/season/round: {e}',
+                f'Error getting matches by league/season from round: {e}',
                 league_id=league_id,
                 season=season,
-                round_number=round_number,
+                start_round=start_round,
             )
             return []
 
@@ -378,3 +475,35 @@ class MatchRepository(BaseRepository[Match]):
                 country=country_name,
             )
             return None
+
+    async def get_leagues_by_names_and_countries(
+        self, leagues: list[tuple[str, str]]
+    ) -> dict[tuple[str, str], League]:
+        """Get several leagues in one query, keyed by (league_name, country_name)"""
+        if not leagues:
+            return {}
+        try:
+            keys = {
+                (league_name, normalize_country_name(country_name)): (
+                    league_name,
+                    country_name,
+                )
+                for league_name, country_name in leagues
+            }
+            result = await self.session.execute(
+                select(League).where(
+                    or_(
+                        *(
+                            and_(League.name == name, League.country == country)
+                            for name, country in keys
+                        )
+                    )
+                )
+            )
+            return {
+                keys[(league.name, league.country)]: league
+                for league in result.scalars()
+            }
+        except Exception as e:
+            logger.error(f'Error getting leagues: {e}', leagues=leagues)
+            return {}
@@ -614,3 +614,136 @@ async def test_get_team_matches_by_season_and_rounds_ordering(db_session):
     assert matches[0].match_date == datetime(2024, 1, 20)  # Latest date first
     assert matches[1].match_date == datetime(2024, 1, 15)  # Second latest
     assert matches[2].match_date == datetime(2024, 1, 10)  # Earliest last
+
+
+@pytest.mark.asyncio
+async def test_get_recent_matches_for_teams(db_session):
+    """Test batch recent matches match the per-team lookup for each team's date"""
+    repo = MatchRepository(db_session)
+
+    from app.db.sqlalchemy_models import League, Match, Team
+
+    league = League(name='Test League', country='Test Country')
+    db_session.add(league)
+    await db_session.commit()
+
+    team_a, team_b, team_c = (
+        Team(name=name, league_id=league.id) for name in ('A', 'B', 'C')
+    )
+    db_session.add_all([team_a, team_b, team_c])
+    await db_session.commit()
+
+    # Team A plays every round; B and C alternate as its opponent
+    for round_num in range(1, 7):
+        opponent = team_b if round_num % 2 else team_c
+        db_session.add(
+            Match(
+                league_id=league.id,
+                home_team_id=team_a.id if round_num % 2 else opponent.id,
+                away_team_id=opponent.id if round_num % 2 else team_a.id,
+                home_score=1,
+                away_score=0,
+                status='finished',
+                season=2024,
+                round=round_num,
+                match_date=datetime(2024, 1, 10 + round_num),
+            )
+        )
+    await db_session.commit()
+
+    before_dates = {
+        team_a.id: datetime(2024, 1, 16),
+        team_b.id: datetime(2024, 1, 16),
+        team_c.id: datetime(2024, 1, 12),
+    }
+    recent_matches = await repo.get_recent_matches_for_teams(
+        before_dates, 2024, limit=2
+    )
+
+    for team_id, before_date in before_dates.items():
+        expected = await repo.get_team_matches_by_season_and_rounds(
+            team_id, 2024, before_date=before_date, limit=2
+        )
+        assert [m.id for m in recent_matches[team_id]] == [m.id for m in expected]
+    assert [m.match_date for m in recent_matches[team_a.id]] == [
+        datetime(2024, 1, 15),
+        datetime(2024, 1, 14),
+    ]
+    assert [m.round for m in recent_matches[team_b.id]] == [5, 3]
+    assert recent_matches[team_c.id] == []
+
+
+@pytest.mark.asyncio
+async def test_get_leagues_by_names_and_countries(db_session):
+    """Test batch league lookup is keyed by the requested name and country"""
+    repo = MatchRepository(db_session)
+
+    from app.db.sqlalchemy_models import League
+
+    premier = League(name='Premier League', country='England')
+    la_liga = League(name='LaLiga', country='Spain')
+    db_session.add_all([premier, la_liga])
+    await db_session.commit()
+
+    leagues = await repo.get_leagues_by_names_and_countries(
+        [
+            ('Premier League', 'england'),
+            ('LaLiga', 'Spain'),
+            ('Serie A', 'Italy'),
+        ]
+    )
+
+    assert leagues == {
+        ('Premier League', 'england'): premier,
+        ('LaLiga', 'Spain'): la_liga,
+    }
+    assert await repo.get_leagues_by_names_and_countries([]) == {}
+
+
+@pytest.mark.asyncio
+async def test_get_matches_by_league_season_from_round(db_session):
+    """Test finished matches from a round onwards come back by round and date"""
+    repo = MatchRepository(db_session)
+
+    from app.db.sqlalchemy_models import League, Match, Team
+
+    league = League(name='Test League', country='Test Country')
+    db_session.add(league)
+    await db_session.commit()
+
+    home, away = (
+        Team(name='Home', league_id=league.id),
+        Team(name='Away', league_id=league.id),
+    )
+    db_session.add_all([home, away])
+    await db_session.commit()
+
+    for round_num, day, status in [
+        (2, 20, 'finished'),
+        (1, 1, 'finished'),
+        (3, 5, 'finished'),
+        (2, 10, 'finished'),
+        (3, 6, 'scheduled'),
+    ]:
+        db_session.add(
+            Match(
+                league_id=league.id,
+                home_team_id=home.id,
+                away_team_id=away.id,
+                match_date=datetime(2024, 1, day),
+                season=2024,
+                round=round_num,
+                status=status,
+            )
+        )
+    await db_session.commit()
+
+    matches = await repo.get_matches_by_league_season_from_round(
+        league.id, 2024, start_round=2
+    )
+
+    assert [(m.round, m.match_date.day) for m in matches] == [
+        (2, 10),
+        (2, 20),
+        (3, 5),
+    ]
@@ -7,11 +7,13 @@ from sqlalchemy import (
     DateTime,
     Float,
     ForeignKey,
+    Index,
     Integer,
     String,
     Text,
     UniqueConstraint,
     create_engine,
+    text,
 )
 from sqlalchemy.ext.declarative import declarative_base
 from sqlalchemy.orm import relationship
@@ -143,6 +145,26 @@ class Match(Base):
     created_at = Column(DateTime, default=datetime.now)
     updated_at = Column(DateTime, default=datetime.now, onupdate=datetime.now)
 
+    # Partial indexes for a team's recent finished matches, one per side
+    __table_args__ = (
+        Index(
+            'idx_match_home_team_finished',
+            'home_team_id',
+            'season',
+            'match_date',
+            sqlite_where=text("status = 'finished'"),
+            postgresql_where=text("status = 'finished'"),
+        ),
+        Index(
+            'idx_match_away_team_finished',
+            'away_team_id',
+            'season',
+            'match_date',
+            sqlite_where=text("status = 'finished'"),
+            postgresql_where=text("status = 'finished'"),
+        ),
+    )
+
     # Relationships
     league = relationship('League', back_populates='matches', lazy='selectin')
     home_team = relationship(
@@ -162,17 +184,21 @@ class Match(Base):
     def __str__(self):
         return f'{self.home_team.name} - {self.away_team.name} ({self.status})'
 
+    def to_dict(self) -> dict:
+        """Get the MatchData fields as a plain dictionary"""
+        return {
+            'id': self.id,
+            'home_team_id': self.home_team_id,
+            'away_team_id': self.away_team_id,
+            'home_score': self.home_score,
+            'away_score': self.away_score,
+            'match_date': self.match_date.isoformat() if self.match_date else None,
+            'status': self.status,
+        }
+
     def to_pydantic(self):
         """Convert SQLAlchemy Match model to Pydantic MatchData"""
-        return MatchData(
-            id=self.id,
-            home_team_id=self.home_team_id,
-            away_team_id=self.away_team_id,
-            home_score=self.home_score,
-            away_score=self.away_score,
-            match_date=self.match_date.isoformat() if self.match_date else None,
-            status=self.status,
-        )
+        return MatchData.model_validate(self.to_dict())
 
 
 class BettingOpportunity(Base):
@@ -1,6 +1,11 @@
+import asyncio
+from collections.abc import AsyncIterator
+from contextlib import asynccontextmanager
+from dataclasses import dataclass
 from datetime import datetime
 import re
 from typing import Any
+from urllib.parse import urlsplit
 
 from playwright.async_api import (
     Browser,
@@ -18,9 +23,158 @@ from .constants import DEFAULT_SEASON, LEAGUES_OF_INTEREST
 
 logger = structlog.get_logger()
 
+# Precompiled patterns for the per-match parsing helpers
+_DATETIME_RE = re.compile(r'(\w+)\s+(\d+)\s+(\d+):(\d+)\s+(AM|PM)')
+_SEASON_RE = re.compile(r'^(\d+)')
+_ROUND_NUM_RE = re.compile(r'(\d+)')
+_TIME_PART_RE = re.compile(r'(\d{1,2}:\d{2}\s+(?:AM|PM))')
+_MINUTE_STRIP_RE = re.compile(r'[^\d+]')
+
+_MONTH_MAP = {
+    'Jan': 1,
+    'Feb': 2,
+    'Mar': 3,
+    'Apr': 4,
+    'May': 5,
+    'Jun': 6,
+    'Jul': 7,
+    'Aug': 8,
+    'Sep': 9,
+    'Oct': 10,
+    'Nov': 11,
+    'Dec': 12,
+}
+
+# Class tokens every scheduled fixture row carries
+FIXTURE_ROW_CLASSES = (
+    'event__match',
+    'event__match--withRowLink',
+    'event__match--static',
+    'event__match--scheduled',
+)
 
-class CommonMatchData(BaseModel):
-    """Common match data structure for all match types"""
+# Upper bound on fixture rows read from the browser at the same time
+MAX_CONCURRENT_FIXTURES = 5
+
+# Site-wide selectors shared by the live and fixtures scrapers
+SEL_HOME_TEAM = '.event__homeParticipant span[data-testid="wcl-scores-simple-text-01"]'
+SEL_AWAY_TEAM = '.event__awayParticipant span[data-testid="wcl-scores-simple-text-01"]'
+SEL_SCORE_HOME = 'span[data-testid="wcl-matchRowScore"][data-side="1"]'
+SEL_SCORE_AWAY = 'span[data-testid="wcl-matchRowScore"][data-side="2"]'
+SEL_MINUTE = '.event__stage'
+SEL_RED_HOME = '.event__homeParticipant svg[data-testid="wcl-icon-incidents-red-card"]'
+SEL_RED_AWAY = '.event__awayParticipant svg[data-testid="wcl-icon-incidents-red-card"]'
+
+# Reads every live match field in a single round trip per match element
+LIVE_MATCH_JS = """(el, sel) => {
+    const text = s => el.querySelector(s)?.innerText || '';
+    return {
+        home: text(sel.home),
+        away: text(sel.away),
+        scoreHome: text(sel.scoreHome),
+        scoreAway: text(sel.scoreAway),
+        minute: text(sel.minute),
+        redHome: !!el.querySelector(sel.redHome),
+        redAway: !!el.querySelector(sel.redAway),
+    };
+}"""
+MATCH_ROW_SELECTORS = {
+    'home': SEL_HOME_TEAM,
+    'away': SEL_AWAY_TEAM,
+    'scoreHome': SEL_SCORE_HOME,
+    'scoreAway': SEL_SCORE_AWAY,
+    'minute': SEL_MINUTE,
+    'redHome': SEL_RED_HOME,
+    'redAway': SEL_RED_AWAY,
+}
+
+# Reads a league header's country, and its league name only when the country
+# is one we monitor, in a single round trip
+LEAGUE_HEADER_JS = """(el, countries) => {
+    const country = el.querySelector('.headerLeague__category-text');
+    const league = el.querySelector('.headerLeague__title-text');
+    if (!country || !league) return null;
+    const countryText = country.innerText;
+    if (!countries.includes(countryText.trim().toLowerCase())) {
+        return {country: countryText, league: null};
+    }
+    return {country: countryText, league: league.innerText};
+}"""
+
+# Reads every results round header with the match rows up to the next round
+# in one round trip
+ROUNDS_MATCHES_JS = """rounds => rounds.map(round => {
+    const matches = [];
+    for (let el = round.nextElementSibling; el; el = el.nextElementSibling) {
+        const cls = el.className;
+        if (cls.includes('event__match') && cls.includes('event__match--withRowLink')) {
+            const team = side =>
+                el.querySelector(side)?.querySelector('span, strong')?.innerText ?? null;
+            const text = sel => el.querySelector(sel)?.innerText ?? null;
+            matches.push({
+                home: team('.event__homeParticipant'),
+                away: team('.event__awayParticipant'),
+                homeScore: text('.event__score.event__score--home'),
+                awayScore: text('.event__score.event__score--away'),
+                time: text('.event__time'),
+            });
+        } else if (cls.includes('event__round')) {
+            break;
+        }
+    }
+    return {text: round.innerText, matches};
+})"""
+
+# Reads text, class name and match-cell presence of every child of the fixtures
+# container in one round trip
+CONTAINER_ROWS_JS = """els => els.map(e => {
+    const cls = e.className;
+    // Only static match rows can be fixtures; skip the subtree queries otherwise
+    const isStatic = cls.includes('event__match--static');
+    return {
+        text: e.textContent,
+        cls: cls,
+        hasTime: isStatic && !!e.querySelector('.event__time'),
+        hasHome: isStatic && !!e.querySelector('.event__homeParticipant'),
+        hasAway: isStatic && !!e.querySelector('.event__awayParticipant'),
+    };
+})"""
+
+# Reads a scheduled fixture row's time and team names in one round trip
+FIXTURE_JS = """(el, sel) => ({
+    time: el.querySelector('.event__time')?.textContent ?? null,
+    home: el.querySelector(sel.home)?.textContent ?? null,
+    away: el.querySelector(sel.away)?.textContent ?? null,
+})"""
+
+# Reads every standings row (team cell, link, rank and value cells) in one round trip
+STANDINGS_ROWS_JS = """rows => rows.map(row => {
+    const team = row.querySelector('.table__cell--participant');
+    if (!team) return null;
+    const link = team.querySelector('a.tableCellParticipant__name');
+    const rank = row.querySelector('.table__cell--rank');
+    return {
+        name: team.innerText,
+        href: link ? link.getAttribute('href') : null,
+        rank: rank ? rank.innerText : null,
+        values: [...row.querySelectorAll('.table__cell--value')].map(c => c.innerText),
+    };
+})"""
+
+
+def _toint(value: str | None, default: int = 0) -> int:
+    """Parse an integer from scraped text, falling back to ``default``"""
+    # Empty cells are common (e.g. unplayed scores); avoid raising for them
+    if not value:
+        return default
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return default
+
+
+class CommonMatchDataModel(BaseModel):
+    """Validated match data, used at persistence/API boundaries"""
 
     home_team: str
     away_team: str
@@ -37,6 +191,29 @@ class CommonMatchData(BaseModel):
     season: int = DEFAULT_SEASON
 
 
+@dataclass(slots=True)
+class CommonMatchData:
+    """Common match data structure for all match types.
+
+    Plain slotted dataclass so the scraping loops do not pay for Pydantic
+    validation; validate with ``CommonMatchDataModel`` at boundaries.
+    """
+
+    home_team: str
+    away_team: str
+    league: str
+    country: str
+    home_score: int | None = None
+    away_score: int | None = None
+    status: str = 'scheduled'
+    round_number: int | None = None
+    match_date: datetime | None = None
+    minute: int | None = None
+    red_cards_home: int = 0
+    red_cards_away: int = 0
+    season: int = DEFAULT_SEASON
+
+
 class LivesportScraper:
     """Unified scraper for livesport.com with common functionality for live matches and league data"""
 
@@ -44,6 +221,15 @@ class LivesportScraper:
 
     def __init__(self, scrape_coaches: bool = True) -> None:
         self.monitored_leagues = LEAGUES_OF_INTEREST
+        # Lowercased lookups built once for _is_monitored_league
+        self._monitored_index: dict[str, frozenset[str]] = {
+            country.lower(): frozenset(league.lower() for league in leagues)
+            for country, leagues in self.monitored_leagues.items()
+        }
+        self._monitored_flat: frozenset[str] = frozenset().union(
+            *self._monitored_index.values()
+        )
+        self._monitored_countries = list(self._monitored_index)
         self.browser_args = [
             '--no-sandbox',
             '--disable-setuid-sandbox',
@@ -66,7 +252,13 @@ class LivesportScraper:
         }
         self._playwright: Playwright | None = None
         self._browser: Browser | None = None
-        self._cookie_banner_closed: bool = False
+        self._page: Page | None = None
+        # Cookie consent state is tracked per page and origin
+        self._page_origins: dict[Page, str] = {}
+        self._cookie_banner_closed: set[Page] = set()
+        self._coach_cache: dict[str, str] = {}
+        self._datetime_cache: dict[tuple[str, int | None, bool], datetime | None] = {}
+        self._fixtures_cache: dict[tuple[str, str], list[CommonMatchData]] = {}
 
         self._scrape_coaches = scrape_coaches
 
@@ -85,6 +277,16 @@ class LivesportScraper:
     ) -> None:
         """Async context manager exit - cleanup resources"""
         logger.info('Cleaning up LivesportScraper resources')
+        try:
+            if self._page:
+                await self._page.close()
+        except Exception as e:
+            logger.error(f'Error closing page: {e}')
+        finally:
+            self._page = None
+            self._page_origins.clear()
+            self._cookie_banner_closed.clear()
+
         try:
             if self._browser:
                 await self._browser.close()
@@ -110,14 +312,35 @@ class LivesportScraper:
         return self._browser
 
     async def _setup_page(self, browser: Browser) -> Page:
-        """Setup and return a page instance with common configuration"""
-        page = await browser.new_page()
-        await page.set_extra_http_headers(self.headers)
-        return page
+        """Return the shared page instance, creating it on first use.
+
+        A single page is reused for every scrape within the context manager
+        lifetime; ``page.goto`` replaces the content on each navigation.
+        """
+        if self._page is None:
+            self._page = await browser.new_page()
+            await self._page.set_extra_http_headers(self.headers)
+        return self._page
+
+    @asynccontextmanager
+    async def _context_page(self, browser: Browser) -> AsyncIterator[Page]:
+        """Yield a page on an isolated context, closed on exit even on errors
+
+        Used for scrapes that run concurrently and must not share navigation.
+        """
+        async with await browser.new_context(
+            extra_http_headers=self.headers
+        ) as context:
+            page = await context.new_page()
+            try:
+                yield page
+            finally:
+                self._page_origins.pop(page, None)
+                self._cookie_banner_closed.discard(page)
 
     async def _handle_cookie_banner(self, page: Page) -> None:
         """Handle cookie banner if present"""
-        if self._cookie_banner_closed:
+        if page in self._cookie_banner_closed:
             return
 
         try:
@@ -125,7 +348,7 @@ class LivesportScraper:
             cookie_button = await page.query_selector('button:has-text("I Accept")')
             if cookie_button:
                 await cookie_button.click()
-                self._cookie_banner_closed = True
+                self._cookie_banner_closed.add(page)
                 logger.info('Closed cookie banner')
         except Exception as e:
             logger.info(f'No cookie banner to close: {e}')
@@ -135,6 +358,12 @@ class LivesportScraper:
     ) -> bool:
         """Navigate to URL and wait for specific selector to load"""
         try:
+            # Cookie consent is per origin, so only re-check it on origin change
+            origin = urlsplit(url).netloc
+            if origin != self._page_origins.get(page):
+                self._page_origins[page] = origin
+                self._cookie_banner_closed.discard(page)
+
             logger.info(f'Navigating to {url}')
             await page.goto(url, wait_until='domcontentloaded', timeout=timeout)
             logger.info('Page loaded successfully')
@@ -185,7 +414,14 @@ class LivesportScraper:
             if live_tab:
                 await live_tab.click()
                 logger.info('Clicked LIVE tab')
-                await page.wait_for_timeout(5000)
+                # Proceed as soon as the live list (or its empty state) renders
+                try:
+                    await page.wait_for_selector(
+                        '.event__match--live, .sportName.soccer .event__noGames',
+                        timeout=10000,
+                    )
+                except TimeoutError:
+                    logger.warning('Live matches list did not render after LIVE click')
             else:
                 logger.warning('LIVE tab not found')
 
@@ -209,6 +445,8 @@ class LivesportScraper:
             results = []
             current_league = None
             current_country = None
+            # All live matches share the scrape time as their match date
+            scraped_at = datetime.now()
 
             # Process elements iteratively
             for i, element in enumerate(all_elements):
@@ -219,30 +457,33 @@ class LivesportScraper:
 
                     # Check if this is a league header
                     if 'headerLeague' in class_name:
-                        # Extract league information
-                        country_el = await element.query_selector(
-                            '.headerLeague__category-text'
-                        )
-                        league_el = await element.query_selector(
-                            '.headerLeague__title-text'
+                        # Extract league information, skipping the league name
+                        # for countries we do not monitor
+                        header = await element.evaluate(
+                            LEAGUE_HEADER_JS, self._monitored_countries
                         )
 
-                        if country_el and league_el:
-                            country = await country_el.inner_text()
-                            league = await league_el.inner_text()
+                        if header:
+                            country = header['country']
+                            league = header['league']
 
                             # Check if this is a monitored league
-                            if self._is_monitored_league(league, country):
+                            if league and self._is_monitored_league(league, country):
                                 current_league = league
-                                current_country = country
+                                # Normalize country name once per league header
+                                current_country = country.title()
                                 logger.debug(
-                                    f'Found monitored league: {country} - {league}'
+                                    'Found monitored league',
+                                    country=country,
+                                    league=league,
                                 )
                             else:
                                 current_league = None
                                 current_country = None
                                 logger.debug(
-                                    f'Skipping non-monitored league: {country} - {league}'
+                                    'Skipping non-monitored league',
+                                    country=country,
+                                    league=league,
                                 )
 
                     # Check if this is a live match
@@ -252,64 +493,37 @@ class LivesportScraper:
                             logger.debug('Skipping match: no monitored league context')
                             continue
 
-                        # Extract match data
-                        home_el = await element.query_selector(
-                            '.event__homeParticipant span[data-testid="wcl-scores-simple-text-01"]'
-                        )
-                        away_el = await element.query_selector(
-                            '.event__awayParticipant span[data-testid="wcl-scores-simple-text-01"]'
+                        # Extract all match fields in one round trip
+                        fields = await element.evaluate(
+                            LIVE_MATCH_JS, MATCH_ROW_SELECTORS
                         )
-
-                        home = await home_el.inner_text() if home_el else ''
-                        away = await away_el.inner_text() if away_el else ''
+                        home = fields['home']
+                        away = fields['away']
 
                         if not home or not away:
                             logger.debug('Skipping match: missing team names')
                             continue
 
-                        # Extract scores
-                        score_home_el = await element.query_selector(
-                            'span[data-testid="wcl-matchRowScore"][data-side="1"]'
-                        )
-                        score_away_el = await element.query_selector(
-                            'span[data-testid="wcl-matchRowScore"][data-side="2"]'
-                        )
-                        score_home = (
-                            await score_home_el.inner_text() if score_home_el else ''
-                        )
-                        score_away = (
-                            await score_away_el.inner_text() if score_away_el else ''
-                        )
-
-                        # Extract minute
-                        minute_el = await element.query_selector('.event__stage')
-                        minute_text = await minute_el.inner_text() if minute_el else ''
-                        minute = self._extract_minute(minute_text)
-
-                        # Extract red cards from SVG elements with data-testid="wcl-icon-incidents-red-card"
-                        red_card_home = await element.query_selector(
-                            '.event__homeParticipant svg[data-testid="wcl-icon-incidents-red-card"]'
-                        )
-                        red_card_away = await element.query_selector(
-                            '.event__awayParticipant svg[data-testid="wcl-icon-incidents-red-card"]'
-                        )
-                        red_cards_home = 1 if red_card_home else 0
-                        red_cards_away = 1 if red_card_away else 0
+                        score_home = fields['scoreHome']
+                        score_away = fields['scoreAway']
+                        minute = self._extract_minute(fields['minute'])
+                        red_cards_home = 1 if fields['redHome'] else 0
+                        red_cards_away = 1 if fields['redAway'] else 0
 
                         # Convert scores to integers
-                        home_score = int(score_home) if score_home.isdigit() else 0
-                        away_score = int(score_away) if score_away.isdigit() else 0
+                        home_score = _toint(score_home)
+                        away_score = _toint(score_away)
 
                         # Create common match format
                         match_data = self._create_common_match_data(
                             home_team=home,
                             away_team=away,
                             league=current_league,
-                            country=current_country.title(),  # Normalize country name
+                            country=current_country,
                             home_score=home_score,
                             away_score=away_score,
                             status='live',
-                            match_date=datetime.now(),  # Set current time for live matches
+                            match_date=scraped_at,
                             minute=minute,
                             red_cards_home=red_cards_home,
                             red_cards_away=red_cards_away,
@@ -318,7 +532,11 @@ class LivesportScraper:
 
                         results.append(match_data)
                         logger.info(
-                            f'Scraped match: {home} vs {away} ({current_country}: {current_league})'
+                            'Scraped live match',
+                            home=home,
+                            away=away,
+                            country=current_country,
+                            league=current_league,
                         )
 
                 except Exception as e:
@@ -333,7 +551,11 @@ class LivesportScraper:
             return []
 
     async def scrape_league_standings(
-        self, country: str, league_name: str, season: int | None = None
+        self,
+        country: str,
+        league_name: str,
+        season: int | None = None,
+        page: Page | None = None,
     ) -> list[dict[str, Any]]:
         """Scrape league standings from livesport.com
 
@@ -342,6 +564,7 @@ class LivesportScraper:
             league_name: League name (e.g., 'Premier League')
             season: Optional season year (e.g., 2024). If None, parses season from page.
                     If provided, constructs URL for archived season (e.g., -2024-2025)
+            page: Optional page to scrape with. If None, uses the shared page.
         """
         # Track if we're scraping an archived season (season parameter was provided)
         is_archived_season = season is not None
@@ -362,7 +585,8 @@ class LivesportScraper:
         browser = await self._setup_browser()
 
         try:
-            page = await self._setup_page(browser)
+            if page is None:
+                page = await self._setup_page(browser)
 
             if not await self._navigate_and_wait(page, url, '.ui-table__body', 60000):
                 return []
@@ -374,99 +598,63 @@ class LivesportScraper:
             else:
                 parsed_season = season
 
-            # Use optimized selectors to get table rows directly
-            table_rows = await page.query_selector_all('.ui-table__row')
+            # Read the whole table in one round trip, then parse in Python
+            table_rows = await page.eval_on_selector_all(
+                '.ui-table__row', STANDINGS_ROWS_JS
+            )
             logger.info(f'Found {len(table_rows)} table rows')
             standings_data = []
             team_urls = []  # Store team URLs for coach scraping
 
             # First pass: extract all team data and URLs
-            for row in table_rows:
+            for cells in table_rows:
                 try:
-                    # Extract team name from the participant cell
-                    team_element = await row.query_selector('.table__cell--participant')
-                    if not team_element:
+                    if cells is None:
                         continue
 
-                    # Find the team link element with class "tableCellParticipant__name"
-                    team_link = await team_element.query_selector(
-                        'a.tableCellParticipant__name'
-                    )
-
-                    team_name = await team_element.inner_text()
-                    team_name = team_name.strip()
+                    team_name = cells['name'].strip()
 
                     if not team_name or len(team_name) < 2:
                         continue
 
                     # Extract team URL if link exists
                     team_url = None
-                    if team_link:
-                        team_link_href = await team_link.get_attribute('href')
-                        if team_link_href:
-                            if team_link_href.startswith('/'):
-                                team_url = f'https://www.livesport.com{team_link_href}'
-                            else:
-                                team_url = team_link_href
+                    team_link_href = cells['href']
+                    if team_link_href:
+                        if team_link_href.startswith('/'):
+                            team_url = f'https://www.livesport.com{team_link_href}'
+                        else:
+                            team_url = team_link_href
 
                     # Extract rank from the rank cell
-                    rank_element = await row.query_selector('.table__cell--rank')
                     rank = None
-                    if rank_element:
-                        rank_text = await rank_element.inner_text()
-                        if rank_text and '.' in rank_text:
-                            rank = int(rank_text.replace('.', '').strip())
+                    rank_text = cells['rank']
+                    if rank_text and '.' in rank_text:
+                        rank = int(rank_text.replace('.', '').strip())
 
                     # Extract stats using specific cell selectors
                     played = (
                         wins
                     ) = draws = losses = goals_for = goals_against = points = 0
 
-                    # Get all value cells in the row
-                    value_cells = await row.query_selector_all('.table__cell--value')
+                    value_cells = cells['values']
 
                     if len(value_cells) >= 6:
-                        # GP (Games Played) - first value cell
-                        gp_text = await value_cells[0].inner_text()
-                        if gp_text.isdigit():
-                            played = int(gp_text)
-
-                        # W (Wins) - second value cell
-                        w_text = await value_cells[1].inner_text()
-                        if w_text.isdigit():
-                            wins = int(w_text)
-
-                        # T (Draws) - third value cell
-                        t_text = await value_cells[2].inner_text()
-                        if t_text.isdigit():
-                            draws = int(t_text)
-
-                        # L (Losses) - fourth value cell
-                        l_text = await value_cells[3].inner_text()
-                        if l_text.isdigit():
-                            losses = int(l_text)
+                        # GP, W, T, L - first four value cells
+                        played = _toint(value_cells[0])
+                        wins = _toint(value_cells[1])
+                        draws = _toint(value_cells[2])
+                        losses = _toint(value_cells[3])
 
                         # G (Goals - format "17:3") - fifth value cell
-                        g_text = await value_cells[4].inner_text()
-                        if ':' in g_text:
-                            goals_parts = g_text.split(':')
-                            if len(goals_parts) == 2:
-                                goals_for = (
-                                    int(goals_parts[0])
-                                    if goals_parts[0].isdigit()
-                                    else 0
-                                )
-                                goals_against = (
-                                    int(goals_parts[1])
-                                    if goals_parts[1].isdigit()
-                                    else 0
-                                )
+                        goals_parts = value_cells[4].split(':')
+                        if len(goals_parts) == 2:
+                            goals_for = _toint(goals_parts[0])
+                            goals_against = _toint(goals_parts[1])
 
                         # Pts (Points) - seventh value cell (skip GD)
                         if len(value_cells) >= 7:
-                            pts_text = await value_cells[6].inner_text()
-                            if pts_text.isdigit():
-                                points = int(pts_text)
+                            points = _toint(value_cells[6])
 
                     team_data = {
                         'team': {'name': team_name},
@@ -484,7 +672,7 @@ class LivesportScraper:
 
                     standings_data.append(team_data)
                     team_urls.append(team_url)  # Store URL for coach scraping
-                    logger.debug(f'Extracted team: {team_name} (rank {rank})')
+                    logger.debug('Extracted team', team=team_name, rank=rank)
 
                 except Exception as e:
                     logger.error(f'Error parsing standings row: {e}')
@@ -504,7 +692,9 @@ class LivesportScraper:
                         if coach:
                             team_data['coach'] = coach
                             logger.debug(
-                                f'Scraped coach for {team_data["team"]["name"]}: {coach}'
+                                'Scraped coach',
+                                team=team_data['team']['name'],
+                                coach=coach,
                             )
                     except Exception as e:
                         logger.warning(
@@ -526,7 +716,14 @@ class LivesportScraper:
             return []
 
     async def _scrape_team_coach_by_url(self, page: Page, team_url: str) -> str | None:
-        """Scrape coach name from team page using URL"""
+        """Scrape coach name from team page using URL.
+
+        Successful lookups are cached per team URL for the scraper lifetime,
+        so repeated teams across leagues/seasons are not re-navigated.
+        """
+        if team_url in self._coach_cache:
+            return self._coach_cache[team_url]
+
         try:
             logger.debug(f'Navigating to team page: {team_url}')
 
@@ -544,55 +741,53 @@ class LivesportScraper:
 
                 await squad_tab.click()
                 logger.debug('Clicked Squad tab')
-                await page.wait_for_timeout(3000)  # Wait for content to load
+                # Wait for squad tables instead of a fixed delay
+                try:
+                    await page.wait_for_selector('.lineupTable__title', timeout=5000)
+                except TimeoutError:
+                    logger.warning('Squad tables did not render after Squad click')
 
             except Exception as e:
                 logger.warning(f'Error clicking Squad tab: {e}')
                 return None
 
-            # Find all lineupTable elements
-            lineup_tables = await page.query_selector_all(
-                '.lineupTable.lineupTable--soccer'
+            # Find the lineup table titled "Coach" and read its names in one call
+            coach_names = await page.evaluate(
+                """() => {
+                    const tables = document.querySelectorAll(
+                        '.lineupTable.lineupTable--soccer'
+                    );
+                    for (const table of tables) {
+                        const title = table.querySelector('.lineupTable__title');
+                        if (title && title.innerText.trim() === 'Coach') {
+                            return [...table.querySelectorAll('a.lineupTable__cell--name')]
+                                .map(link => link.innerText.trim())
+                                .filter(Boolean);
+                        }
+                    }
+                    return [];
+                }"""
             )
 
-            coach_names = []
-            # Find the table with title "Coach"
-            for table in lineup_tables:
-                try:
-                    title_element = await table.query_selector('.lineupTable__title')
-                    if not title_element:
-                        continue
-
-                    title_text = await title_element.inner_text()
-                    if title_text and title_text.strip() == 'Coach':
-                        # Found the coach table, now extract all coach names
-                        coach_links = await table.query_selector_all(
-                            'a.lineupTable__cell--name'
-                        )
-                        for coach_link in coach_links:
-                            coach_name = await coach_link.inner_text()
-                            if coach_name:
-                                coach_name_clean = coach_name.strip()
-                                logger.debug(f'Found coach: {coach_name_clean}')
-                                coach_names.append(coach_name_clean)
-                        # Break after finding the Coach table to avoid checking other tables
-                        break
-                except Exception as e:
-                    logger.debug(f'Error checking lineup table: {e}')
-                    continue
-
             if not coach_names:
                 logger.warning('Coach table not found on squad page')
                 return None
 
-            return ', '.join(coach_names)
+            logger.debug(f'Found coaches: {coach_names}')
+            coach = ', '.join(coach_names)
+            self._coach_cache[team_url] = coach
+            return coach
 
         except Exception as e:
             logger.error(f'Error scraping team coach: {e}')
             return None
 
     async def scrape_league_matches(
-        self, country: str, league_name: str, season: int | None = None
+        self,
+        country: str,
+        league_name: str,
+        season: int | None = None,
+        page: Page | None = None,
     ) -> list[CommonMatchData]:
         """Scrape league matches from livesport.com
 
@@ -601,6 +796,7 @@ class LivesportScraper:
             league_name: League name (e.g., 'Premier League')
             season: Optional season year (e.g., 2024). If None, parses season from page.
                     If provided, constructs URL for archived season (e.g., -2024-2025)
+            page: Optional page to scrape with. If None, uses the shared page.
         """
         country_lower = country.lower().replace(' ', '-')
         league_lower = league_name.lower().replace(' ', '-')
@@ -615,11 +811,13 @@ class LivesportScraper:
             url = f'https://www.livesport.com/soccer/{country_lower}/{league_lower}/results/'
 
         logger.info(f'Scraping league matches from: {url} (season: {season})')
+        self._datetime_cache.clear()
 
         browser = await self._setup_browser()
 
         try:
-            page = await self._setup_page(browser)
+            if page is None:
+                page = await self._setup_page(browser)
 
             if not await self._navigate_and_wait(
                 page, url, '.event__round--static', 60000
@@ -646,24 +844,24 @@ class LivesportScraper:
 
             # Use the correct selectors based on the HTML structure
             matches_data = []
-            processed_matches = set()
+            processed_matches: set[tuple[str, str]] = set()
+            country_name = country.title()  # Normalize country name once
 
-            # Find all round containers
-            round_containers = await page.query_selector_all(
-                '.event__round.event__round--static'
+            # Read all round containers and their matches at once
+            rounds_data = await page.eval_on_selector_all(
+                '.event__round.event__round--static', ROUNDS_MATCHES_JS
             )
-            logger.info(f'Found {len(round_containers)} round containers')
+            logger.info(f'Found {len(rounds_data)} round containers')
 
-            for round_container in round_containers:
+            for round_data in rounds_data:
                 try:
-                    # Get round information
-                    round_text = await round_container.inner_text()
+                    round_text = round_data['text']
                     round_info = round_text.strip() if round_text else None
 
                     # Extract round number from round text
                     round_number = None
                     if round_info:
-                        match = re.search(r'(\d+)', round_info)
+                        match = _ROUND_NUM_RE.search(round_info)
                         if match:
                             round_number = int(match.group(1))
                             round_info = f'Round {round_number}'
@@ -674,123 +872,52 @@ class LivesportScraper:
                         )
                         continue
 
-                    # Find matches that belong to this specific round
-                    # We need to iterate through siblings until we hit the next round
-                    current_element = await round_container.query_selector(
-                        'xpath=following-sibling::*[1]'
-                    )
-                    match_containers = []
-
-                    while current_element:
-                        # Check if this is a match container
-                        class_name = await current_element.get_attribute('class')
-                        if (
-                            class_name
-                            and 'event__match' in class_name
-                            and 'event__match--withRowLink' in class_name
-                        ):
-                            match_containers.append(current_element)
-                        # Check if we hit the next round (stop here)
-                        elif class_name and 'event__round' in class_name:
-                            break
-
-                        # Move to next sibling
-                        current_element = await current_element.query_selector(
-                            'xpath=following-sibling::*[1]'
-                        )
-
-                    for match_container in match_containers:
-                        try:
-                            # Extract home team
-                            home_participant = await match_container.query_selector(
-                                '.event__homeParticipant'
-                            )
-                            if not home_participant:
-                                continue
-
-                            home_team_element = await home_participant.query_selector(
-                                'span, strong'
-                            )
-                            if not home_team_element:
-                                continue
-                            home_team = await home_team_element.inner_text()
-
-                            # Extract away team
-                            away_participant = await match_container.query_selector(
-                                '.event__awayParticipant'
-                            )
-                            if not away_participant:
-                                continue
-
-                            away_team_element = await away_participant.query_selector(
-                                'span, strong'
-                            )
-                            if not away_team_element:
-                                continue
-                            away_team = await away_team_element.inner_text()
-
-                            # Skip if we already processed this match
-                            match_key = f'{home_team}_{away_team}'
-                            if match_key in processed_matches:
-                                continue
-                            processed_matches.add(match_key)
-
-                            # Extract scores
-                            home_score_element = await match_container.query_selector(
-                                '.event__score.event__score--home'
-                            )
-                            away_score_element = await match_container.query_selector(
-                                '.event__score.event__score--away'
-                            )
-
-                            home_score = 0
-                            away_score = 0
-
-                            if home_score_element:
-                                home_score_text = await home_score_element.inner_text()
-                                if home_score_text and home_score_text.isdigit():
-                                    home_score = int(home_score_text)
+                    for row in round_data['matches']:
+                        home_team = row['home']
+                        away_team = row['away']
+                        if home_team is None or away_team is None:
+                            continue
 
-                            if away_score_element:
-                                away_score_text = await away_score_element.inner_text()
-                                if away_score_text and away_score_text.isdigit():
-                                    away_score = int(away_score_text)
+                        # Skip if we already processed this match
+                        match_key = (home_team, away_team)
+                        if match_key in processed_matches:
+                            continue
+                        processed_matches.add(match_key)
 
-                            # Extract match date
-                            time_element = await match_container.query_selector(
-                                '.event__time'
-                            )
-                            match_date = None
-                            if time_element:
-                                date_text = await time_element.inner_text()
-                                if date_text:
-                                    match_date = self._parse_match_date(
-                                        date_text, season, is_cross_year=is_cross_year
-                                    )
-
-                            # Create common match format
-                            match_data = self._create_common_match_data(
-                                home_team=home_team,
-                                away_team=away_team,
-                                league=league_name,
-                                country=country.title(),  # Normalize country name
-                                home_score=home_score,
-                                away_score=away_score,
-                                status='finished',
-                                match_date=match_date,
-                                round_number=round_number,
-                                season=season,
+                        # Extract scores
+                        home_score = _toint(row['homeScore'])
+                        away_score = _toint(row['awayScore'])
+
+                        # Extract match date
+                        match_date = None
+                        date_text = row['time']
+                        if date_text:
+                            match_date = self._parse_datetime(
+                                date_text, season, is_cross_year=is_cross_year
                             )
 
-                            matches_data.append(match_data)
-                            logger.debug(
-                                f'Extracted match: {home_team} vs {away_team} '
-                                f'({home_score}:{away_score}) - {round_info}'
-                            )
+                        # Create common match format
+                        match_data = self._create_common_match_data(
+                            home_team=home_team,
+                            away_team=away_team,
+                            league=league_name,
+                            country=country_name,
+                            home_score=home_score,
+                            away_score=away_score,
+                            status='finished',
+                            match_date=match_date,
+                            round_number=round_number,
+                            season=season,
+                        )
 
-                        except Exception as e:
-                            logger.error(f'Error parsing individual match: {e}')
-                            continue
+                        matches_data.append(match_data)
+                        logger.debug(
+                            'Extracted match',
+                            home=home_team,
+                            away=away_team,
+                            score=(home_score, away_score),
+                            round=round_info,
+                        )
 
                 except Exception as e:
                     logger.error(f'Error parsing round: {e}')
@@ -803,6 +930,42 @@ class LivesportScraper:
             logger.error(f'Unexpected error while scraping matches: {e}')
             return []
 
+    async def scrape_league_all(
+        self, country: str, league_name: str, season: int | None = None
+    ) -> tuple[list[dict[str, Any]], list[CommonMatchData]]:
+        """Scrape league standings and matches concurrently
+
+        Each scrape runs on its own browser context so their navigations
+        do not interfere with each other.
+
+        Args:
+            country: Country name (e.g., 'England')
+            league_name: League name (e.g., 'Premier League')
+            season: Optional season year (e.g., 2024). If None, parses season from page.
+
+        Returns:
+            Tuple of (standings, matches)
+        """
+        browser = await self._setup_browser()
+
+        async with (
+            self._context_page(browser) as standings_page,
+            self._context_page(browser) as matches_page,
+            asyncio.TaskGroup() as tg,
+        ):
+            standings_task = tg.create_task(
+                self.scrape_league_standings(
+                    country, league_name, season, page=standings_page
+                )
+            )
+            matches_task = tg.create_task(
+                self.scrape_league_matches(
+                    country, league_name, season, page=matches_page
+                )
+            )
+
+        return standings_task.result(), matches_task.result()
+
     async def _load_all_results_rounds(self, page: Page) -> None:
         """Click 'Show more games' until all historical rounds are loaded.
 
@@ -856,26 +1019,19 @@ class LivesportScraper:
         if not league_name:
             return False
 
+        league_key = league_name.lower()
+
         # If country is provided, check for exact match with country
         if country:
-            for monitored_country, leagues in self.monitored_leagues.items():
-                if monitored_country.lower() == country.lower():
-                    for league in leagues:
-                        if league.lower() == league_name.lower():
-                            return True
-            return False
+            leagues = self._monitored_index.get(country.lower())
+            return leagues is not None and league_key in leagues
 
         # Fallback: check for exact matches without country (for backward compatibility)
         if league_name in self.monitored_leagues:
             return True
 
-        # Check for partial matches (e.g., "Premier League" matches "English Premier League")
-        for _, leagues in self.monitored_leagues.items():
-            for league in leagues:
-                if league.lower() == league_name.lower():
-                    return True
-
-        return False
+        # Case-insensitive match against leagues of any monitored country
+        return league_key in self._monitored_flat
 
     def _extract_minute(self, minute_text: str) -> int | None:
         """Extract minute from text like '2' or '45+2'"""
@@ -884,7 +1040,7 @@ class LivesportScraper:
 
         try:
             # Remove any non-numeric characters except '+'
-            clean_text = ''.join(c for c in minute_text if c.isdigit() or c == '+')
+            clean_text = _MINUTE_STRIP_RE.sub('', minute_text)
 
             if '+' in clean_text:
                 # Handle injury time like "45+2"
@@ -917,7 +1073,7 @@ class LivesportScraper:
             # Extract first number before "/" from text like "2025/2026"
             # If there's a "/", it's a cross-year season
             is_cross_year = '/' in season_text
-            season_match = re.search(r'^(\d+)', season_text.strip())
+            season_match = _SEASON_RE.match(season_text.strip())
             if season_match:
                 season = int(season_match.group(1))
                 logger.debug(
@@ -938,6 +1094,22 @@ class LivesportScraper:
 
     def _parse_datetime(
         self, date_text: str, season: int | None = None, is_cross_year: bool = True
+    ) -> datetime | None:
+        """Parse datetime from text, reusing results for repeated texts.
+
+        Matches of the same round often share a kickoff text, so parsed values
+        are cached per scrape (the cache is cleared by each ``scrape_*`` call).
+        """
+        key = (date_text, season, is_cross_year)
+        if key in self._datetime_cache:
+            return self._datetime_cache[key]
+
+        parsed = self._parse_datetime_text(date_text, season, is_cross_year)
+        self._datetime_cache[key] = parsed
+        return parsed
+
+    def _parse_datetime_text(
+        self, date_text: str, season: int | None = None, is_cross_year: bool = True
     ) -> datetime | None:
         """Parse datetime from text in various formats:
         - 'Aug 25\n12:00 AM' (newline-separated)
@@ -958,8 +1130,7 @@ class LivesportScraper:
 
             # Match pattern: "Month Day HH:MM AM/PM"
             # e.g., "Aug 25 12:00 AM" or "Aug 30 06:00 PM"
-            pattern = r'(\w+)\s+(\d+)\s+(\d+):(\d+)\s+(AM|PM)'
-            match = re.match(pattern, normalized_text)
+            match = _DATETIME_RE.match(normalized_text)
             if not match:
                 return None
 
@@ -970,25 +1141,10 @@ class LivesportScraper:
             ampm = match.group(5)
 
             # Convert month name to number
-            month_map = {
-                'Jan': 1,
-                'Feb': 2,
-                'Mar': 3,
-                'Apr': 4,
-                'May': 5,
-                'Jun': 6,
-                'Jul': 7,
-                'Aug': 8,
-                'Sep': 9,
-                'Oct': 10,
-                'Nov': 11,
-                'Dec': 12,
-            }
-
-            if month_name not in month_map:
+            month = _MONTH_MAP.get(month_name)
+            if month is None:
                 return None
 
-            month = month_map[month_name]
             year = season
 
             # Logic for cross-year seasons (e.g., 2025/2026):
@@ -1009,18 +1165,6 @@ class LivesportScraper:
             logger.error(f'Error parsing datetime "{date_text}": {e}')
             return None
 
-    def _parse_match_date(
-        self, date_text: str, season: int | None = None, is_cross_year: bool = True
-    ) -> datetime | None:
-        """Parse match date from text like 'Aug 25\n12:00 AM'
-
-        Args:
-            date_text: Date text to parse
-            season: Optional season year. If None, uses DEFAULT_SEASON
-            is_cross_year: Whether this is a cross-year season
-        """
-        return self._parse_datetime(date_text, season, is_cross_year=is_cross_year)
-
     async def scrape_league_fixtures(
         self, country: str, league_name: str, season: int | None = None
     ) -> list[CommonMatchData]:
@@ -1036,14 +1180,20 @@ class LivesportScraper:
             logger.error('No fixtures for historical seasons are available')
             return []
 
+        country_slug = country.lower()
+        league_slug = league_name.lower().replace(' ', '-')
+        # The same fixtures page is only scraped successfully once per session
+        cache_key = (country_slug, league_slug)
+        if cache_key in self._fixtures_cache:
+            return list(self._fixtures_cache[cache_key])
+
         logger.info(
             f'Scraping fixtures for {country}: {league_name} (season: {season})'
         )
+        self._datetime_cache.clear()
 
         try:
             # Build the fixtures URL
-            country_slug = country.lower()
-            league_slug = league_name.lower().replace(' ', '-')
 
             # Add season suffix for archived seasons (e.g., premier-league-2024-2025)
             if season is not None:
@@ -1082,9 +1232,12 @@ class LivesportScraper:
 
             # Extract the first scheduled match only
             fixtures = await self._extract_fixtures(
-                page, country, league_name, season, is_cross_year=is_cross_year
+                page, country.title(), league_name, season, is_cross_year=is_cross_year
             )
 
+            # Empty results may come from a failed extraction, so retry them
+            if fixtures:
+                self._fixtures_cache[cache_key] = list(fixtures)
             return fixtures
 
         except Exception as e:
@@ -1116,7 +1269,7 @@ class LivesportScraper:
             # Extract round number from round text
             round_number = None
             if round_text:
-                match = re.search(r'(\d+)', round_text)
+                match = _ROUND_NUM_RE.search(round_text)
                 if match:
                     round_number = int(match.group(1))
                     round_text = f'Round {round_number}'
@@ -1129,14 +1282,19 @@ class LivesportScraper:
                 logger.warning('Parent container not found')
                 return []
 
+            # Read text/class of every child in bulk from the same handles, so rows
+            # stay aligned even if the live page changes in between; handles are
+            # only used for the match rows that get extracted
             all_elements = await parent_container.query_selector_all(':scope > *')
+            rows = await page.evaluate(CONTAINER_ROWS_JS, all_elements)
 
-            fixtures = []
+            match_elements = []
             found_first_round = False
             collecting_matches = False
+            target_round = round_text.strip()
 
-            for element in all_elements:
-                element_text = await element.text_content()
+            for element, row in zip(all_elements, rows, strict=True):
+                element_text = row['text']
                 if not element_text:
                     continue
 
@@ -1144,7 +1302,7 @@ class LivesportScraper:
                 if (
                     not found_first_round
                     and 'Round' in element_text
-                    and element_text.strip() == round_text.strip()
+                    and element_text.strip() == target_round
                 ):
                     found_first_round = True
                     collecting_matches = True
@@ -1155,7 +1313,7 @@ class LivesportScraper:
                 if (
                     collecting_matches
                     and 'Round' in element_text
-                    and element_text.strip() != round_text.strip()
+                    and element_text.strip() != target_round
                 ):
                     logger.info(
                         f'Found next round, stopping collection: {element_text}'
@@ -1163,8 +1321,16 @@ class LivesportScraper:
                     break
 
                 # If we're collecting matches and this looks like a match element
-                if collecting_matches and await self._is_match_element(element):
-                    fixture = await self._extract_single_fixture(
+                if collecting_matches and self._is_match_element(row):
+                    match_elements.append(element)
+
+            # Extract the round's fixtures concurrently, bounded to keep the
+            # browser responsive
+            semaphore = asyncio.Semaphore(MAX_CONCURRENT_FIXTURES)
+
+            async def extract(element: ElementHandle) -> CommonMatchData | None:
+                async with semaphore:
+                    return await self._extract_single_fixture(
                         element,
                         country,
                         league_name,
@@ -1172,12 +1338,17 @@ class LivesportScraper:
                         season,
                         is_cross_year=is_cross_year,
                     )
-                    if fixture:
-                        fixtures.append(fixture)
-                        logger.info(
-                            f'Extracted fixture: {fixture.home_team} vs '
-                            f'{fixture.away_team} on {fixture.match_date}'
-                        )
+
+            fixtures = []
+            for fixture in await asyncio.gather(*map(extract, match_elements)):
+                if fixture:
+                    fixtures.append(fixture)
+                    logger.info(
+                        'Extracted fixture',
+                        home=fixture.home_team,
+                        away=fixture.away_team,
+                        match_date=fixture.match_date,
+                    )
 
             logger.info(f'Total fixtures extracted for {round_text}: {len(fixtures)}')
             return fixtures
@@ -1186,40 +1357,20 @@ class LivesportScraper:
             logger.error(f'Error extracting fixtures: {e}')
             return []
 
-    async def _is_match_element(self, element: ElementHandle) -> bool:
-        """Check if an element represents a match (has the correct class structure)"""
-        try:
-            # Check if element has the match class structure
-            class_name = await element.get_attribute('class')
-            if not class_name:
-                return False
-
-            # Check if it has the required match classes
-            has_match_classes = (
-                'event__match' in class_name
-                and 'event__match--withRowLink' in class_name
-                and 'event__match--static' in class_name
-                and 'event__match--scheduled' in class_name
-            )
-
-            if not has_match_classes:
-                return False
-
-            # Also check if it has time and team elements
-            has_time = await element.query_selector('.event__time') is not None
-            has_home_team = (
-                await element.query_selector('.event__homeParticipant') is not None
-            )
-            has_away_team = (
-                await element.query_selector('.event__awayParticipant') is not None
-            )
-
-            return has_time and has_home_team and has_away_team
+    def _is_match_element(self, row: dict[str, Any]) -> bool:
+        """Check if a container row (see CONTAINER_ROWS_JS) represents a match"""
+        # Check if element has the match class structure
+        class_name = row['cls']
+        if not class_name:
+            return False
 
-        except Exception as e:
-            logger.error(f'Error checking if element is match: {e}')
+        # Check if it has the required match classes
+        if not all(token in class_name for token in FIXTURE_ROW_CLASSES):
             return False
 
+        # Also check if it has time and team elements
+        return row['hasTime'] and row['hasHome'] and row['hasAway']
+
     async def _extract_single_fixture(
         self,
         element: ElementHandle,
@@ -1234,28 +1385,30 @@ class LivesportScraper:
             # Use DEFAULT_SEASON if season is not provided
             if season is None:
                 season = self.DEFAULT_SEASON
+            # Read time and team names in one round trip
+            fields = await element.evaluate(FIXTURE_JS, MATCH_ROW_SELECTORS)
+
             # Extract date and time from the event__time element
-            time_element = await element.query_selector('.event__time')
-            if not time_element:
+            time_text = fields['time']
+            if time_text is None:
                 logger.warning('No time element found in match')
                 return None
 
-            time_text = await time_element.text_content()
             if not time_text:
                 logger.warning('No time text found in time element')
                 return None
 
             # Parse the date and time (format: "Aug 30\n06:00 PM" or "Aug 3006:00 PM")
             # First try to split by newline
-            lines = time_text.strip().split('\n')
-            if len(lines) >= 2:
+            head, sep, tail = time_text.strip().partition('\n')
+            if sep:
                 # Format: "Aug 30\n06:00 PM"
-                date_part = lines[0].strip()  # "Aug 30"
-                time_part = lines[1].strip()  # "06:00 PM"
+                date_part = head.strip()  # "Aug 30"
+                time_part = tail.partition('\n')[0].strip()  # "06:00 PM"
             else:
                 # Format: "Aug 3006:00 PM" - need to separate date and time
                 # Find where the time pattern starts (HH:MM)
-                time_match = re.search(r'(\d{1,2}:\d{2}\s+(AM|PM))', time_text)
+                time_match = _TIME_PART_RE.search(time_text)
                 if not time_match:
                     logger.warning(f'Could not find time pattern in: {time_text}')
                     return None
@@ -1265,27 +1418,21 @@ class LivesportScraper:
                 date_part = time_text[: time_match.start()].strip()  # "Aug 30"
 
             # Extract home team
-            home_element = await element.query_selector(
-                '.event__homeParticipant span[data-testid="wcl-scores-simple-text-01"]'
-            )
-            if not home_element:
+            home_team = fields['home']
+            if home_team is None:
                 logger.warning('No home team element found')
                 return None
 
-            home_team = await home_element.text_content()
             if not home_team:
                 logger.warning('No home team text found')
                 return None
 
             # Extract away team
-            away_element = await element.query_selector(
-                '.event__awayParticipant span[data-testid="wcl-scores-simple-text-01"]'
-            )
-            if not away_element:
+            away_team = fields['away']
+            if away_team is None:
                 logger.warning('No away team element found')
                 return None
 
-            away_team = await away_element.text_content()
             if not away_team:
                 logger.warning('No away team text found')
                 return None
@@ -1294,7 +1441,7 @@ class LivesportScraper:
             date_time_text = f'{date_part} {time_part}'
 
             # Parse the date and time
-            match_datetime = self._parse_fixture_datetime(
+            match_datetime = self._parse_datetime(
                 date_time_text, season, is_cross_year=is_cross_year
             )
 
@@ -1307,7 +1454,7 @@ class LivesportScraper:
                 home_team=home_team.strip(),
                 away_team=away_team.strip(),
                 league=league_name,  # Will be set by caller
-                country=country.title(),  # Normalize country name
+                country=country,
                 home_score=None,
                 away_score=None,
                 status='scheduled',
@@ -1317,7 +1464,11 @@ class LivesportScraper:
             )
 
             logger.debug(
-                f'Extracted fixture: {home_team} vs {away_team} on {date_part} at {time_part}'
+                'Parsed fixture time',
+                home=home_team,
+                away=away_team,
+                date=date_part,
+                time=time_part,
             )
             return fixture
 
@@ -1325,18 +1476,6 @@ class LivesportScraper:
             logger.error(f'Error extracting single fixture: {e}')
             return None
 
-    def _parse_fixture_datetime(
-        self, date_text: str, season: int | None = None, is_cross_year: bool = True
-    ) -> datetime | None:
-        """Parse fixture datetime from text like 'Aug 30 06:00 PM'
-
-        Args:
-            date_text: Date text to parse
-            season: Optional season year. If None, uses DEFAULT_SEASON
-            is_cross_year: Whether this is a cross-year season
-        """
-        return self._parse_datetime(date_text, season, is_cross_year=is_cross_year)
-
     def _create_common_match_data(
         self,
         home_team: str,
@@ -1353,19 +1492,23 @@ class LivesportScraper:
         round_number: int = None,
         season: int = DEFAULT_SEASON,
     ) -> CommonMatchData:
-        """Create a common match data structure for all match types"""
+        """Create a common match data structure for all match types.
+
+        ``country`` is expected to be normalized (title case) by the caller.
+        """
+        # Positional arguments follow the CommonMatchData field order
         return CommonMatchData(
-            home_team=home_team,
-            away_team=away_team,
-            league=league,
-            country=country.title() if country else country,  # Normalize country name
-            home_score=home_score,
-            away_score=away_score,
-            status=status,
-            round_number=round_number,
-            match_date=match_date,
-            minute=minute,
-            red_cards_home=red_cards_home,
-            red_cards_away=red_cards_away,
-            season=season,
+            home_team,
+            away_team,
+            league,
+            country,
+            home_score,
+            away_score,
+            status,
+            round_number,
+            match_date,
+            minute,
+            red_cards_home,
+            red_cards_away,
+            season,
         )
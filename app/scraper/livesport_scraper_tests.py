@@ -1,75 +1,83 @@
 """Tests for LivesportScraper context manager functionality"""
 
+from dataclasses import asdict
+from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import pytest
 
-from app.scraper.livesport_scraper import LivesportScraper
+from app.scraper.livesport_scraper import (
+    CONTAINER_ROWS_JS,
+    LivesportScraper,
+    _toint,
+)
+
+
+@pytest.fixture
+def mocked_scraper():
+    """Scraper with Playwright patched to return mocked browser and page"""
+    with patch('app.scraper.livesport_scraper.async_playwright') as mock_playwright:
+        mock_playwright_instance = AsyncMock()
+        mock_browser = AsyncMock()
+        mock_page = AsyncMock()
+        mock_browser.new_page = AsyncMock(return_value=mock_page)
+        mock_playwright_instance.chromium.launch = AsyncMock(return_value=mock_browser)
+        mock_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright_instance
+        )
+
+        yield (
+            LivesportScraper(),
+            mock_playwright,
+            mock_playwright_instance,
+            mock_browser,
+            mock_page,
+        )
 
 
 class TestLivesportScraperContextManager:
     """Test the context manager functionality of LivesportScraper"""
 
-    @pytest.mark.asyncio
-    async def test_context_manager_initialization(self):
-        """Test that the context manager properly initializes resources"""
-        with patch('app.scraper.livesport_scraper.async_playwright') as mock_playwright:
-            # Mock the playwright instance
-            mock_playwright_instance = AsyncMock()
-            mock_browser = AsyncMock()
-            mock_playwright_instance.chromium.launch = AsyncMock(
-                return_value=mock_browser
-            )
-            mock_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_instance
-            )
+    # The tests patch module globals, so they run one at a time on a shared loop
+    pytestmark = pytest.mark.asyncio(loop_scope='class')
 
-            scraper = LivesportScraper()
+    async def test_context_manager_initialization(self, mocked_scraper):
+        """Test that the context manager properly initializes resources"""
+        scraper, mock_playwright, mock_playwright_instance, mock_browser, _ = (
+            mocked_scraper
+        )
 
-            # Test context manager entry
-            async with scraper as scraper_instance:
-                assert scraper_instance is scraper
-                assert scraper._playwright is not None
-                assert scraper._browser is not None
+        # Test context manager entry
+        async with scraper as scraper_instance:
+            assert scraper_instance is scraper
+            assert scraper._playwright is not None
+            assert scraper._browser is not None
 
-                # Verify playwright was started
-                mock_playwright.return_value.start.assert_called_once()
+            # Verify playwright was started
+            mock_playwright.return_value.start.assert_called_once()
 
-                # Verify browser was launched
-                mock_playwright_instance.chromium.launch.assert_called_once()
+            # Verify browser was launched
+            mock_playwright_instance.chromium.launch.assert_called_once()
 
-            # Test context manager exit - resources should be cleaned up
-            mock_browser.close.assert_called_once()
-            mock_playwright_instance.stop.assert_called_once()
+        # Test context manager exit - resources should be cleaned up
+        mock_browser.close.assert_called_once()
+        mock_playwright_instance.stop.assert_called_once()
 
-    @pytest.mark.asyncio
-    async def test_context_manager_cleanup_on_exception(self):
+    async def test_context_manager_cleanup_on_exception(self, mocked_scraper):
         """Test that resources are cleaned up even when an exception occurs"""
-        with patch('app.scraper.livesport_scraper.async_playwright') as mock_playwright:
-            # Mock the playwright instance
-            mock_playwright_instance = AsyncMock()
-            mock_browser = AsyncMock()
-            mock_playwright_instance.chromium.launch = AsyncMock(
-                return_value=mock_browser
-            )
-            mock_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_instance
-            )
-
-            scraper = LivesportScraper()
+        scraper, _, mock_playwright_instance, mock_browser, _ = mocked_scraper
 
-            # Test that cleanup happens even with exceptions
-            try:
-                async with scraper:
-                    raise ValueError('Test exception')
-            except ValueError:
-                pass
+        # Test that cleanup happens even with exceptions
+        try:
+            async with scraper:
+                raise ValueError('Test exception')
+        except ValueError:
+            pass
 
-            # Verify cleanup was called
-            mock_browser.close.assert_called_once()
-            mock_playwright_instance.stop.assert_called_once()
+        # Verify cleanup was called
+        mock_browser.close.assert_called_once()
+        mock_playwright_instance.stop.assert_called_once()
 
-    @pytest.mark.asyncio
     async def test_setup_browser_without_context_manager(self):
         """Test that _setup_browser raises error when not used as context manager"""
         scraper = LivesportScraper()
@@ -80,79 +88,420 @@ class TestLivesportScraperContextManager:
         ):
             await scraper._setup_browser()
 
-    @pytest.mark.asyncio
-    async def test_context_manager_reuse(self):
+    async def test_context_manager_reuse(self, mocked_scraper):
         """Test that the context manager can be reused"""
-        with patch('app.scraper.livesport_scraper.async_playwright') as mock_playwright:
-            # Mock the playwright instance
-            mock_playwright_instance = AsyncMock()
-            mock_browser = AsyncMock()
-            mock_playwright_instance.chromium.launch = AsyncMock(
-                return_value=mock_browser
-            )
-            mock_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_instance
-            )
+        scraper, mock_playwright, mock_playwright_instance, mock_browser, _ = (
+            mocked_scraper
+        )
 
-            scraper = LivesportScraper()
+        # First use
+        async with scraper:
+            assert scraper._playwright is not None
+            assert scraper._browser is not None
 
-            # First use
-            async with scraper:
-                assert scraper._playwright is not None
-                assert scraper._browser is not None
-
-            # Second use - create new mocks for the second context manager use
-            mock_playwright_instance2 = AsyncMock()
-            mock_browser2 = AsyncMock()
-            mock_playwright_instance2.chromium.launch = AsyncMock(
-                return_value=mock_browser2
-            )
-            mock_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_instance2
-            )
+        # Second use - create new mocks for the second context manager use
+        mock_playwright_instance2 = AsyncMock()
+        mock_browser2 = AsyncMock()
+        mock_playwright_instance2.chromium.launch = AsyncMock(
+            return_value=mock_browser2
+        )
+        mock_playwright.return_value.start = AsyncMock(
+            return_value=mock_playwright_instance2
+        )
 
-            async with scraper:
-                assert scraper._playwright is not None
-                assert scraper._browser is not None
+        async with scraper:
+            assert scraper._playwright is not None
+            assert scraper._browser is not None
 
-            # Verify cleanup was called for both instances
-            assert mock_browser.close.call_count == 1
-            assert mock_browser2.close.call_count == 1
-            assert mock_playwright_instance.stop.call_count == 1
-            assert mock_playwright_instance2.stop.call_count == 1
+        # Verify cleanup was called for both instances
+        assert mock_browser.close.call_count == 1
+        assert mock_browser2.close.call_count == 1
+        assert mock_playwright_instance.stop.call_count == 1
+        assert mock_playwright_instance2.stop.call_count == 1
 
-    @pytest.mark.asyncio
-    async def test_scrape_methods_with_context_manager(self):
+    async def test_scrape_methods_with_context_manager(self, mocked_scraper):
         """Test that scraping methods work with context manager"""
-        with patch('app.scraper.livesport_scraper.async_playwright') as mock_playwright:
-            # Mock the playwright instance
-            mock_playwright_instance = AsyncMock()
-            mock_browser = AsyncMock()
-            mock_page = AsyncMock()
-
-            # Mock page methods
-            mock_page.goto = AsyncMock()
-            mock_page.wait_for_selector = AsyncMock()
-            mock_page.query_selector_all = AsyncMock(return_value=[])
-            mock_page.get_by_text = MagicMock()
-            mock_page.wait_for_timeout = AsyncMock()
-
-            mock_browser.new_page = AsyncMock(return_value=mock_page)
-            mock_playwright_instance.chromium.launch = AsyncMock(
-                return_value=mock_browser
-            )
-            mock_playwright.return_value.start = AsyncMock(
-                return_value=mock_playwright_instance
+        scraper, _, mock_playwright_instance, mock_browser, mock_page = mocked_scraper
+
+        # Mock page methods
+        mock_page.query_selector_all = AsyncMock(return_value=[])
+        mock_page.get_by_text = MagicMock()
+
+        # Test that scraping methods work within context manager
+        async with scraper:
+            # This should not raise an error
+            result = await scraper.scrape_live_matches()
+            assert isinstance(result, list)
+
+        # Verify cleanup was called
+        mock_browser.close.assert_called_once()
+        mock_playwright_instance.stop.assert_called_once()
+
+    async def test_page_is_reused_across_scrape_calls(self, mocked_scraper):
+        """Test that a single page is shared by scrape calls and closed on exit"""
+        scraper, _, _, mock_browser, mock_page = mocked_scraper
+
+        async with scraper:
+            browser = await scraper._setup_browser()
+            first_page = await scraper._setup_page(browser)
+            second_page = await scraper._setup_page(browser)
+
+            assert first_page is second_page
+            mock_browser.new_page.assert_called_once()
+
+        # Page is closed and released on exit
+        mock_page.close.assert_called_once()
+        assert scraper._page is None
+
+    async def test_team_coach_is_cached_by_url(self):
+        """Test that a coach lookup for the same team URL navigates only once"""
+        scraper = LivesportScraper()
+        mock_page = AsyncMock()
+        mock_page.evaluate = AsyncMock(return_value=['Coach Name'])
+        team_url = 'https://www.livesport.com/team/example/abc/'
+
+        first = await scraper._scrape_team_coach_by_url(mock_page, team_url)
+        second = await scraper._scrape_team_coach_by_url(mock_page, team_url)
+
+        assert first == second == 'Coach Name'
+        mock_page.goto.assert_called_once()
+        mock_page.evaluate.assert_called_once()
+
+    async def test_league_fixtures_are_cached_per_session(self):
+        """Test that the same league fixtures page is scraped only once"""
+        scraper = LivesportScraper()
+        fixtures = [MagicMock()]
+
+        with (
+            patch.object(scraper, '_setup_browser', AsyncMock()),
+            patch.object(scraper, '_setup_page', AsyncMock()),
+            patch.object(
+                scraper, '_navigate_and_wait', AsyncMock(return_value=True)
+            ) as navigate,
+            patch.object(
+                scraper, '_parse_season_from_page', AsyncMock(return_value=(2025, True))
+            ),
+            patch.object(scraper, '_handle_cookie_banner', AsyncMock()),
+            patch.object(
+                scraper, '_extract_fixtures', AsyncMock(return_value=fixtures)
+            ),
+        ):
+            first = await scraper.scrape_league_fixtures('England', 'Premier League')
+            second = await scraper.scrape_league_fixtures('england', 'Premier League')
+
+        assert first == second == fixtures
+        assert second is not first
+        navigate.assert_called_once()
+
+    async def test_empty_league_fixtures_are_not_cached(self):
+        """Test that a failed or empty fixtures scrape is retried on the next call"""
+        scraper = LivesportScraper()
+        fixtures = [MagicMock()]
+
+        with (
+            patch.object(scraper, '_setup_browser', AsyncMock()),
+            patch.object(scraper, '_setup_page', AsyncMock()),
+            patch.object(
+                scraper, '_navigate_and_wait', AsyncMock(return_value=True)
+            ) as navigate,
+            patch.object(
+                scraper, '_parse_season_from_page', AsyncMock(return_value=(2025, True))
+            ),
+            patch.object(scraper, '_handle_cookie_banner', AsyncMock()),
+            patch.object(
+                scraper, '_extract_fixtures', AsyncMock(side_effect=[[], fixtures])
+            ),
+        ):
+            first = await scraper.scrape_league_fixtures('England', 'Premier League')
+            second = await scraper.scrape_league_fixtures('England', 'Premier League')
+
+        assert first == []
+        assert second == fixtures
+        assert navigate.call_count == 2
+
+    async def test_scrape_league_all_uses_separate_contexts(self, mocked_scraper):
+        """Test that standings and matches are scraped on their own contexts"""
+        scraper, _, _, mock_browser, _ = mocked_scraper
+        mock_contexts = [AsyncMock(), AsyncMock()]
+        mock_browser.new_context = AsyncMock(side_effect=mock_contexts)
+        scraper.scrape_league_standings = AsyncMock(return_value=[{'rank': 1}])
+        scraper.scrape_league_matches = AsyncMock(return_value=[])
+
+        async with scraper:
+            standings, matches = await scraper.scrape_league_all(
+                'England', 'Premier League'
             )
 
-            scraper = LivesportScraper()
+        assert standings == [{'rank': 1}]
+        assert matches == []
+        standings_page = scraper.scrape_league_standings.call_args.kwargs['page']
+        matches_page = scraper.scrape_league_matches.call_args.kwargs['page']
+        assert standings_page is not matches_page
+        for context in mock_contexts:
+            context.__aexit__.assert_called_once()
+
+    async def test_scrape_league_all_closes_contexts_on_error(self, mocked_scraper):
+        """Test that both contexts are closed when a scrape raises"""
+        scraper, _, _, mock_browser, _ = mocked_scraper
+        mock_contexts = [AsyncMock(), AsyncMock()]
+        mock_browser.new_context = AsyncMock(side_effect=mock_contexts)
+        scraper.scrape_league_standings = AsyncMock(side_effect=RuntimeError('boom'))
+        scraper.scrape_league_matches = AsyncMock(return_value=[])
+
+        async with scraper:
+            with pytest.raises(ExceptionGroup):
+                await scraper.scrape_league_all('England', 'Premier League')
+
+        for context in mock_contexts:
+            context.__aexit__.assert_called_once()
+        assert not scraper._page_origins
+        mock_browser.close.assert_called_once()
+
+    async def test_scrape_league_standings_parses_table_rows(self):
+        """Test that standings rows read in bulk are parsed into team data"""
+        scraper = LivesportScraper(scrape_coaches=False)
+        scraper._browser = AsyncMock()
+        mock_page = AsyncMock()
+        mock_page.eval_on_selector_all = AsyncMock(
+            return_value=[
+                {
+                    'name': 'Arsenal\n',
+                    'href': '/team/arsenal/abc/',
+                    'rank': '1.',
+                    'values': ['10', '8', '1', '1', '25:7', '18', '25'],
+                },
+                None,
+            ]
+        )
+
+        standings = await scraper.scrape_league_standings(
+            'England', 'Premier League', 2024, page=mock_page
+        )
+
+        assert standings == [
+            {
+                'team': {'name': 'Arsenal'},
+                'rank': 1,
+                'all': {
+                    'played': 10,
+                    'win': 8,
+                    'draw': 1,
+                    'lose': 1,
+                    'goals': {'for': 25, 'against': 7},
+                },
+                'points': 25,
+                'coach': None,
+            }
+        ]
+
+    async def test_scrape_league_matches_parses_round_rows(self):
+        """Test that matches read per round in bulk are parsed into match data"""
+        scraper = LivesportScraper()
+        scraper._browser = AsyncMock()
+        rounds = [
+            {
+                'text': 'Round 3',
+                'matches': [
+                    {
+                        'home': 'Arsenal',
+                        'away': 'Chelsea',
+                        'homeScore': '2',
+                        'awayScore': '1',
+                        'time': 'Aug 30\n06:00 PM',
+                    },
+                    {
+                        'home': None,
+                        'away': 'Everton',
+                        'homeScore': None,
+                        'awayScore': None,
+                        'time': None,
+                    },
+                ],
+            }
+        ]
+        mock_page = AsyncMock()
+        mock_page.query_selector = AsyncMock(return_value=None)
+        mock_page.eval_on_selector_all = AsyncMock(return_value=rounds)
+
+        matches = await scraper.scrape_league_matches(
+            'england', 'Premier League', 2024, page=mock_page
+        )
+
+        assert len(matches) == 1
+        match = matches[0]
+        assert (match.home_team, match.away_team) == ('Arsenal', 'Chelsea')
+        assert (match.home_score, match.away_score) == (2, 1)
+        assert match.country == 'England'
+        assert match.round_number == 3
+        assert match.status == 'finished'
+        assert match.match_date == datetime(2024, 8, 30, 18, 0)
+
+    async def test_extract_fixtures_collects_first_round(self):
+        """Test that only the matches of the first scheduled round are extracted"""
+        scraper = LivesportScraper()
+        match_class = (
+            'event__match event__match--withRowLink '
+            'event__match--static event__match--scheduled'
+        )
+        round_cells = {'hasTime': False, 'hasHome': False, 'hasAway': False}
+        match_cells = {'hasTime': True, 'hasHome': True, 'hasAway': True}
+        rows = [
+            {'text': 'Round 5', 'cls': 'event__round', **round_cells},
+            {'text': 'Arsenal Chelsea', 'cls': match_class, **match_cells},
+            {'text': 'Round 6', 'cls': 'event__round', **round_cells},
+            {'text': 'Everton Fulham', 'cls': match_class, **match_cells},
+        ]
+        elements = [AsyncMock() for _ in rows]
+        elements[1].evaluate = AsyncMock(
+            return_value={
+                'time': 'Sep 13\n03:00 PM',
+                'home': 'Arsenal',
+                'away': 'Chelsea',
+            }
+        )
+
+        first_round = AsyncMock()
+        first_round.text_content = AsyncMock(return_value='Round 5')
+        parent = AsyncMock()
+        parent.query_selector_all = AsyncMock(return_value=elements)
+        mock_page = AsyncMock()
+        mock_page.evaluate = AsyncMock(return_value=rows)
+        mock_page.query_selector_all = AsyncMock(return_value=[first_round])
+        mock_page.query_selector = AsyncMock(return_value=parent)
+
+        fixtures = await scraper._extract_fixtures(
+            mock_page, 'England', 'Premier League', 2025
+        )
+
+        assert len(fixtures) == 1
+        fixture = fixtures[0]
+        assert (fixture.home_team, fixture.away_team) == ('Arsenal', 'Chelsea')
+        assert fixture.round_number == 5
+        assert fixture.status == 'scheduled'
+        assert fixture.match_date == datetime(2025, 9, 13, 15, 0)
+        elements[3].evaluate.assert_not_called()
+        mock_page.evaluate.assert_called_once_with(CONTAINER_ROWS_JS, elements)
+
+
+@pytest.mark.parametrize(
+    'value,expected',
+    [
+        ('17', 17),
+        ('0', 0),
+        ('', 0),
+        ('-', 0),
+        (None, 0),
+    ],
+)
+def test_toint(value, expected):
+    """Test that scraped numeric text is parsed with a 0 fallback"""
+    assert _toint(value) == expected
+
+
+@pytest.mark.parametrize(
+    'league_name,country,expected',
+    [
+        ('Premier League', 'England', True),
+        ('premier league', 'ENGLAND', True),
+        ('Premier League', 'Spain', False),
+        ('LaLiga', 'Scotland', False),
+        ('Serie A', None, True),
+        ('Championship', None, False),
+        ('', 'England', False),
+    ],
+)
+def test_is_monitored_league(league_name, country, expected):
+    """Test case-insensitive monitored league lookup with and without country"""
+    scraper = LivesportScraper()
+    assert scraper._is_monitored_league(league_name, country) is expected
+
+
+def test_parse_datetime_caches_repeated_texts():
+    """Test that repeated kickoff texts are parsed once per scrape"""
+    scraper = LivesportScraper()
+
+    with patch.object(
+        scraper, '_parse_datetime_text', wraps=scraper._parse_datetime_text
+    ) as parse_text:
+        first = scraper._parse_datetime('Jan 04\n03:00 PM', 2024)
+        second = scraper._parse_datetime('Jan 04\n03:00 PM', 2024)
+
+    assert first == second == datetime(2025, 1, 4, 15, 0)
+    parse_text.assert_called_once()
+
+
+@pytest.mark.asyncio
+@pytest.mark.parametrize(
+    'time_text',
+    ['Sep 13\n03:00 PM', 'Sep 1303:00 PM', ' Sep 13 \n 03:00 PM \n'],
+)
+async def test_extract_single_fixture_time_formats(time_text):
+    """Test that both newline-separated and joined fixture times are parsed"""
+    scraper = LivesportScraper()
+    element = AsyncMock()
+    element.evaluate = AsyncMock(
+        return_value={'time': time_text, 'home': 'Arsenal', 'away': 'Chelsea'}
+    )
+
+    fixture = await scraper._extract_single_fixture(
+        element, 'England', 'Premier League', 5, 2025
+    )
+
+    assert fixture.match_date == datetime(2025, 9, 13, 15, 0)
+
+
+def test_create_common_match_data_maps_every_field():
+    """Test that positional construction keeps each value in its own field"""
+    fields = {
+        'home_team': 'Arsenal',
+        'away_team': 'Chelsea',
+        'league': 'Premier League',
+        'country': 'England',
+        'home_score': 2,
+        'away_score': 1,
+        'status': 'live',
+        'match_date': datetime(2025, 9, 13, 15, 0),
+        'minute': 67,
+        'red_cards_home': 1,
+        'red_cards_away': 2,
+        'round_number': 5,
+        'season': 2025,
+    }
+
+    match = LivesportScraper()._create_common_match_data(**fields)
+
+    assert asdict(match) == fields
+
+
+@pytest.mark.parametrize(
+    'cls,expected',
+    [
+        (
+            'event__match event__match--withRowLink event__match--static '
+            'event__match--scheduled event__match--twoLine',
+            True,
+        ),
+        ('event__match event__match--withRowLink event__match--static', False),
+        ('event__round event__round--static', False),
+        ('', False),
+    ],
+)
+def test_is_match_element(cls, expected):
+    """Test that only scheduled match rows with time and teams are matched"""
+    row = {'text': 'x', 'cls': cls, 'hasTime': True, 'hasHome': True, 'hasAway': True}
+    assert bool(LivesportScraper()._is_match_element(row)) is expected
 
-            # Test that scraping methods work within context manager
-            async with scraper:
-                # This should not raise an error
-                result = await scraper.scrape_live_matches()
-                assert isinstance(result, list)
 
-            # Verify cleanup was called
-            mock_browser.close.assert_called_once()
-            mock_playwright_instance.stop.assert_called_once()
+@pytest.mark.parametrize(
+    'minute_text,expected',
+    [
+        ("23'", 23),
+        ("45+2'", 47),
+        ('90+3′', 93),
+        ('Half Time', None),
+        ('', None),
+    ],
+)
+def test_extract_minute(minute_text, expected):
+    """Test live minute parsing including injury time"""
+    assert LivesportScraper()._extract_minute(minute_text) == expected
@@ -1,333 +1,534 @@
 """Script to analyze completed betting opportunities and propose rule improvements"""
-from collections import defaultdict
+from bisect import bisect_left
+from collections import Counter, deque
+from collections.abc import Callable, Iterable
+from concurrent.futures import ProcessPoolExecutor
 import csv
+from functools import lru_cache
+from itertools import islice
+import json
+import os
 from pathlib import Path
+import sys
+from typing import Any
 
 import structlog
 
+from app.scripts.utils import write_lines
 
-logger = structlog.get_logger()
 
+logger = structlog.get_logger()
 
-def analyze_betting_opportunities(csv_file: str = 'betting_opportunities_analysis.csv'):
-    """Analyze betting opportunities and propose improvements"""
-    csv_path = Path(csv_file)
+# Read the CSV in large blocks; rows are still consumed one at a time
+CSV_READ_BUFFER_SIZE = 1024 * 1024
+
+# Files at least this large are aggregated in worker processes, in row batches
+PARALLEL_MIN_FILE_SIZE = 64 * 1024 * 1024
+ROWS_PER_BATCH = 200_000
+
+# Bucket labels and their upper bounds (inclusive); values outside fall in the last
+CONFIDENCE_BUCKETS = ('0.5', '0.5-0.6', '0.6-0.7', '0.7+')
+CONFIDENCE_EDGES = (0.5, 0.6, 0.7)
+RANK_DIFF_BUCKETS = (
+    'Opponent much stronger (-5+)',
+    'Opponent stronger (-2 to -5)',
+    'Similar strength (-2 to +2)',
+    'Opponent weaker (+2 to +5)',
+    'Opponent much weaker (+5+)',
+)
+RANK_DIFF_EDGES = (-5, -2, 2, 5)
+
+# Aggregates stored as (group, outcome) Counters. The cache key covers the
+# bucket tuples above; bump the version for any other change to how rows are
+# aggregated
+COUNTER_AGGREGATES = (
+    'rule_stats',
+    'rank_outcomes',
+    'confidence_stats',
+    'rank_diff_stats',
+    'losses_count_stats',
+)
+AGGREGATES_CACHE_VERSION = 1
+
+# Row layout shared by the per-group win rate tables
+STATS_ROW_TEMPLATE = '{label} | {total:5d} | {wins:4d} | {losses:6d} | {win_rate:6.1f}%'
+
+
+# Numeric columns hold few distinct values (ranks, streaks, scores), so each
+# distinct text is parsed once
+@lru_cache(maxsize=1024)
+def _parse_int(value: str) -> int | None:
+    """Parse an integer CSV value, returning None for 'N/A' or invalid values"""
+    if value == 'N/A':
+        return None
+    try:
+        return int(value)
+    except (ValueError, TypeError):
+        return None
+
+
+@lru_cache(maxsize=1024)
+def _parse_float(value: str) -> float | None:
+    """Parse a float CSV value, returning None for invalid values"""
+    try:
+        return float(value)
+    except (ValueError, TypeError):
+        return None
+
+
+def _stat_keys(stats: Counter) -> set:
+    """Return the grouping keys of a Counter keyed by (key, outcome) tuples"""
+    return {key for key, _ in stats}
+
+
+def _aggregate_rows(
+    rows: Iterable[list[str]], columns: dict[str, int]
+) -> dict[str, Any]:
+    """Aggregate every analysis over a batch of CSV rows
+
+    Args:
+        rows: CSV rows as lists of column values
+        columns: Column name to position map taken from the CSV header
+    """
+    total_opportunities: int = 0
+    # Counters are keyed by (group, outcome) with a (group, 'total') entry per group
+    rule_stats: Counter[tuple[str, str]] = Counter()
+    rank_outcomes: Counter[tuple[int, str]] = Counter()
+    max_rank: int | None = None
+    confidence_stats: Counter[tuple[str, str]] = Counter()
+    rank_diff_stats: Counter[tuple[str, str]] = Counter()
+    losses_count_stats: Counter[tuple[int, str]] = Counter()
+
+    def count_consecutive_losses(row: list[str], outcome: str) -> None:
+        nonlocal max_rank
+
+        # Parse the numeric columns once and pick the analyzed team's side
+        home_rank: int | None = _parse_int(row[home_rank_col])
+        away_rank: int | None = _parse_int(row[away_rank_col])
+        team_rank: int | None
+        opponent_rank: int | None
+        losses: int | None
+        if row[team_analyzed_col] == row[home_team_col]:
+            team_rank = home_rank
+            opponent_rank = away_rank
+            losses = _parse_int(row[home_losses_col])
+        else:
+            team_rank = away_rank
+            opponent_rank = home_rank
+            losses = _parse_int(row[away_losses_col])
+
+        # Analysis 2: Consecutive Losses Rule - Rank analysis
+        if team_rank is not None:
+            rank_outcomes[(team_rank, outcome)] += 1
+            rank_outcomes[(team_rank, 'total')] += 1
+
+        # Track the highest rank seen to identify the bottom 3
+        for rank in (home_rank, away_rank):
+            if rank is not None and (max_rank is None or rank > max_rank):
+                max_rank = rank
+
+        # Analysis 4: Opponent rank difference analysis
+        if team_rank and opponent_rank:
+            rank_diff: int = opponent_rank - team_rank  # Positive = opponent is weaker
+
+            # Bucket the differences
+            bucket: str = RANK_DIFF_BUCKETS[bisect_left(RANK_DIFF_EDGES, rank_diff)]
+
+            rank_diff_stats[(bucket, outcome)] += 1
+            rank_diff_stats[(bucket, 'total')] += 1
+
+        # Analysis 5: Consecutive losses count analysis
+        if losses is not None:
+            losses_count_stats[(losses, outcome)] += 1
+            losses_count_stats[(losses, 'total')] += 1
+
+    # Rule-specific analyses, looked up once per row
+    rule_handlers: dict[str, Callable[[list[str], str], None]] = {
+        'consecutive_losses': count_consecutive_losses,
+    }
 
-    if not csv_path.exists():
-        logger.error(f'CSV file not found: {csv_path}')
-        return
+    # Rows are lists indexed by column position
+    rule_slug_col: int = columns['rule_slug']
+    outcome_col: int = columns['outcome']
+    confidence_col: int = columns['confidence_score']
+    team_analyzed_col: int = columns['team_analyzed']
+    home_team_col: int = columns['home_team']
+    home_rank_col: int = columns['home_team_rank']
+    away_rank_col: int = columns['away_team_rank']
+    home_losses_col: int = columns['home_consecutive_losses']
+    away_losses_col: int = columns['away_consecutive_losses']
+
+    for row in rows:
+        if not row:
+            continue
+
+        total_opportunities += 1
+        rule_slug: str = row[rule_slug_col]
+        outcome: str = row[outcome_col]
+
+        # Analysis 1: Win/Lose rates by rule type
+        rule_stats[(rule_slug, outcome)] += 1
+        rule_stats[(rule_slug, 'total')] += 1
+
+        # Analysis 3: Confidence score effectiveness
+        confidence: float | None = _parse_float(row[confidence_col])
+        if confidence is not None:
+            index: int = bisect_left(CONFIDENCE_EDGES, confidence)
+            # Only exactly 0.5 belongs to the first bucket; lower scores go last
+            if index == 0 and confidence != 0.5:
+                index = len(CONFIDENCE_EDGES)
+            confidence_bucket: str = CONFIDENCE_BUCKETS[index]
+
+            confidence_stats[(confidence_bucket, outcome)] += 1
+            confidence_stats[(confidence_bucket, 'total')] += 1
+
+        handler = rule_handlers.get(rule_slug)
+        if handler is not None:
+            handler(row, outcome)
+
+    return {
+        'total_opportunities': total_opportunities,
+        'rule_stats': rule_stats,
+        'rank_outcomes': rank_outcomes,
+        'max_rank': max_rank,
+        'confidence_stats': confidence_stats,
+        'rank_diff_stats': rank_diff_stats,
+        'losses_count_stats': losses_count_stats,
+    }
 
-    opportunities = []
-    with open(csv_path, encoding='utf-8') as f:
-        reader = csv.DictReader(f)
-        for row in reader:
-            opportunities.append(row)
 
-    logger.info(f'Analyzing {len(opportunities)} betting opportunities')
+def _merge_aggregates(total: dict[str, Any], part: dict[str, Any]) -> None:
+    """Fold the aggregates of one batch of rows into the running totals"""
+    total['total_opportunities'] += part['total_opportunities']
+    for name in COUNTER_AGGREGATES:
+        total[name].update(part[name])
+    if part['max_rank'] is not None and (
+        total['max_rank'] is None or part['max_rank'] > total['max_rank']
+    ):
+        total['max_rank'] = part['max_rank']
+
+
+def _aggregate_opportunities(
+    csv_path: Path, workers: int | None = None
+) -> dict[str, Any] | None:
+    """Aggregate every analysis in a single streaming pass over the CSV
+
+    Large files are split into batches of rows that are aggregated in worker
+    processes and merged here; only a few batches are in flight at a time so
+    memory stays bounded. Returns None when the CSV has no header row.
+    """
+    with open(
+        csv_path, encoding='utf-8', newline='', buffering=CSV_READ_BUFFER_SIZE
+    ) as f:
+        reader = csv.reader(f)
+        header = next(reader, None)
+        if header is None:
+            return None
+        columns = {name: index for index, name in enumerate(header)}
+
+        if csv_path.stat().st_size < PARALLEL_MIN_FILE_SIZE:
+            return _aggregate_rows(reader, columns)
+
+        workers = workers or os.cpu_count() or 1
+        batches = iter(lambda: list(islice(reader, ROWS_PER_BATCH)), [])
+        aggregates = _aggregate_rows([], columns)
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            max_in_flight = workers * 2
+            pending = deque()
+            for batch in batches:
+                pending.append(executor.submit(_aggregate_rows, batch, columns))
+                if len(pending) >= max_in_flight:
+                    _merge_aggregates(aggregates, pending.popleft().result())
+            while pending:
+                _merge_aggregates(aggregates, pending.popleft().result())
+
+    return aggregates
+
+
+def _cache_key(csv_path: Path) -> list[Any]:
+    """Identify a CSV version by its modification time and size, along with the
+    buckets the aggregates were grouped into"""
+    stat = csv_path.stat()
+    # Lists rather than tuples, so the key compares equal after a JSON round trip
+    buckets = [
+        list(CONFIDENCE_BUCKETS),
+        list(CONFIDENCE_EDGES),
+        list(RANK_DIFF_BUCKETS),
+        list(RANK_DIFF_EDGES),
+    ]
+    return [AGGREGATES_CACHE_VERSION, stat.st_mtime_ns, stat.st_size, buckets]
 
-    # Analysis 1: Win/Lose rates by rule type
-    print('\n' + '=' * 80)
-    print('ANALYSIS 1: WIN/LOSE RATES BY RULE TYPE')
-    print('=' * 80)
-
-    rule_stats = defaultdict(lambda: {'win': 0, 'lose': 0, 'total': 0})
-
-    for opp in opportunities:
-        rule_slug = opp['rule_slug']
-        outcome = opp['outcome']
-        rule_stats[rule_slug]['total'] += 1
-        if outcome == 'win':
-            rule_stats[rule_slug]['win'] += 1
-        elif outcome == 'lose':
-            rule_stats[rule_slug]['lose'] += 1
-
-    for rule_slug, stats in sorted(rule_stats.items()):
-        win_rate = (stats['win'] / stats['total']) * 100 if stats['total'] > 0 else 0
-        print(f'\n{rule_slug}:')
-        print(f'  Total: {stats["total"]}')
-        print(f'  Wins: {stats["win"]} ({stats["win"]/stats["total"]*100:.1f}%)')
-        print(f'  Losses: {stats["lose"]} ({stats["lose"]/stats["total"]*100:.1f}%)')
-        print(f'  Win Rate: {win_rate:.1f}%')
 
-    # Analysis 2: Consecutive Losses Rule - Rank analysis
-    print('\n' + '=' * 80)
-    print('ANALYSIS 2: CONSECUTIVE LOSSES RULE - RANK ANALYSIS')
-    print('=' * 80)
+def _load_cached_aggregates(csv_path: Path, cache_path: Path) -> dict[str, Any] | None:
+    """Load aggregates saved for the current CSV version, if any"""
+    try:
+        data = json.loads(cache_path.read_text(encoding='utf-8'))
+    except (OSError, ValueError):
+        return None
 
-    consecutive_losses_opps = [
-        opp for opp in opportunities if opp['rule_slug'] == 'consecutive_losses'
-    ]
+    if data.get('key') != _cache_key(csv_path):
+        return None
 
-    # Group by team rank (need to determine league size)
-    rank_outcomes = defaultdict(lambda: {'win': 0, 'lose': 0, 'total': 0, 'ranks': []})
+    aggregates = data['aggregates']
+    for name in COUNTER_AGGREGATES:
+        aggregates[name] = Counter(
+            {(group, outcome): count for group, outcome, count in aggregates[name]}
+        )
+    return aggregates
+
+
+def _save_cached_aggregates(
+    csv_path: Path, cache_path: Path, aggregates: dict[str, Any]
+) -> None:
+    """Save aggregates next to the CSV, replacing the previous cache atomically"""
+    serializable = dict(aggregates)
+    for name in COUNTER_AGGREGATES:
+        serializable[name] = [
+            [group, outcome, count] for (group, outcome), count in aggregates[name].items()
+        ]
+
+    tmp_path = cache_path.with_suffix('.tmp')
+    try:
+        tmp_path.write_text(
+            json.dumps({'key': _cache_key(csv_path), 'aggregates': serializable}),
+            encoding='utf-8',
+        )
+        tmp_path.replace(cache_path)
+    except OSError as e:
+        logger.warning(f'Could not write aggregates cache {cache_path}: {e}')
 
-    for opp in consecutive_losses_opps:
-        team_analyzed = opp['team_analyzed']
-        outcome = opp['outcome']
 
-        # Find the rank of the team analyzed
-        if team_analyzed == opp['home_team']:
-            rank = opp['home_team_rank']
-        else:
-            rank = opp['away_team_rank']
-
-        if rank != 'N/A':
-            try:
-                rank_int = int(rank)
-                rank_outcomes[rank_int]['total'] += 1
-                rank_outcomes[rank_int]['ranks'].append(rank_int)
-                if outcome == 'win':
-                    rank_outcomes[rank_int]['win'] += 1
-                elif outcome == 'lose':
-                    rank_outcomes[rank_int]['lose'] += 1
-            except (ValueError, TypeError):
-                pass
-
-    print('\nConsecutive Losses Rule - Performance by Team Rank:')
-    print('Rank | Total | Wins | Losses | Win Rate')
-    print('-' * 50)
-
-    for rank in sorted(rank_outcomes.keys()):
-        stats = rank_outcomes[rank]
-        win_rate = (stats['win'] / stats['total']) * 100 if stats['total'] > 0 else 0
-        print(
-            f'{rank:4d} | {stats["total"]:5d} | {stats["win"]:4d} | {stats["lose"]:6d} | {win_rate:6.1f}%'
-        )
+def analyze_betting_opportunities(
+    csv_file: str = 'betting_opportunities_analysis.csv', use_cache: bool = True
+):
+    """Analyze betting opportunities and propose improvements
 
-    # Identify bottom 3 ranks
-    all_ranks = []
-    for opp in consecutive_losses_opps:
-        if opp['home_team_rank'] != 'N/A':
-            try:
-                all_ranks.append(int(opp['home_team_rank']))
-            except (ValueError, TypeError):
-                pass
-        if opp['away_team_rank'] != 'N/A':
-            try:
-                all_ranks.append(int(opp['away_team_rank']))
-            except (ValueError, TypeError):
-                pass
-
-    if all_ranks:
-        max_rank = max(all_ranks)
-        bottom_3_start = max_rank - 2
+    Aggregates are cached in a sidecar ``.agg.json`` file next to the CSV and
+    reused while the CSV modification time and size are unchanged.
+    """
+    csv_path = Path(csv_file)
 
-        print(f'\nBottom 3 ranks analysis (ranks {bottom_3_start}-{max_rank}):')
-        bottom_3_stats = {'win': 0, 'lose': 0, 'total': 0}
-
-        for opp in consecutive_losses_opps:
-            team_analyzed = opp['team_analyzed']
-            outcome = opp['outcome']
-
-            if team_analyzed == opp['home_team']:
-                rank = opp['home_team_rank']
-            else:
-                rank = opp['away_team_rank']
-
-            if rank != 'N/A':
-                try:
-                    rank_int = int(rank)
-                    if rank_int >= bottom_3_start:
-                        bottom_3_stats['total'] += 1
-                        if outcome == 'win':
-                            bottom_3_stats['win'] += 1
-                        elif outcome == 'lose':
-                            bottom_3_stats['lose'] += 1
-                except (ValueError, TypeError):
-                    pass
+    if not csv_path.exists():
+        logger.error(f'CSV file not found: {csv_path}')
+        return
 
-        if bottom_3_stats['total'] > 0:
-            win_rate = (bottom_3_stats['win'] / bottom_3_stats['total']) * 100
-            print(f'  Total: {bottom_3_stats["total"]}')
-            print(f'  Wins: {bottom_3_stats["win"]} ({win_rate:.1f}%)')
-            print(f'  Losses: {bottom_3_stats["lose"]} ({(100-win_rate):.1f}%)')
+    cache_path = csv_path.with_suffix('.agg.json')
+    aggregates = _load_cached_aggregates(csv_path, cache_path) if use_cache else None
+    if aggregates is not None:
+        logger.info(f'Loaded cached aggregates from {cache_path}')
+    else:
+        aggregates = _aggregate_opportunities(csv_path)
+        if aggregates is None:
+            logger.error(f'CSV file is empty: {csv_path}')
+            return
+        if use_cache:
+            _save_cached_aggregates(csv_path, cache_path, aggregates)
+
+    total_opportunities = aggregates['total_opportunities']
+    rule_stats = aggregates['rule_stats']
+    rank_outcomes = aggregates['rank_outcomes']
+    max_rank = aggregates['max_rank']
+    confidence_stats = aggregates['confidence_stats']
+    rank_diff_stats = aggregates['rank_diff_stats']
+    losses_count_stats = aggregates['losses_count_stats']
+
+    logger.info(f'Analyzed {total_opportunities} betting opportunities')
+
+    # Each report section is written to stdout in one call
+    out = []
 
-    # Analysis 3: Confidence score effectiveness
-    print('\n' + '=' * 80)
-    print('ANALYSIS 3: CONFIDENCE SCORE EFFECTIVENESS')
-    print('=' * 80)
-
-    confidence_buckets = {
-        '0.5': {'win': 0, 'lose': 0, 'total': 0},
-        '0.5-0.6': {'win': 0, 'lose': 0, 'total': 0},
-        '0.6-0.7': {'win': 0, 'lose': 0, 'total': 0},
-        '0.7+': {'win': 0, 'lose': 0, 'total': 0},
-    }
+    # Analysis 1: Win/Lose rates by rule type
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 1: WIN/LOSE RATES BY RULE TYPE')
+    out.append('=' * 80)
+
+    for rule_slug in sorted(_stat_keys(rule_stats)):
+        total = rule_stats[(rule_slug, 'total')]
+        wins = rule_stats[(rule_slug, 'win')]
+        losses = rule_stats[(rule_slug, 'lose')]
+        win_rate = (wins / total) * 100 if total > 0 else 0
+        out.append(f'\n{rule_slug}:')
+        out.append(f'  Total: {total}')
+        out.append(f'  Wins: {wins} ({win_rate:.1f}%)')
+        out.append(f'  Losses: {losses} ({losses/total*100:.1f}%)')
+        out.append(f'  Win Rate: {win_rate:.1f}%')
+
+    write_lines(out)
 
-    for opp in opportunities:
-        try:
-            confidence = float(opp['confidence_score'])
-            outcome = opp['outcome']
-
-            if confidence == 0.5:
-                bucket = '0.5'
-            elif 0.5 < confidence <= 0.6:
-                bucket = '0.5-0.6'
-            elif 0.6 < confidence <= 0.7:
-                bucket = '0.6-0.7'
-            else:
-                bucket = '0.7+'
-
-            confidence_buckets[bucket]['total'] += 1
-            if outcome == 'win':
-                confidence_buckets[bucket]['win'] += 1
-            elif outcome == 'lose':
-                confidence_buckets[bucket]['lose'] += 1
-        except (ValueError, TypeError):
-            pass
-
-    print('\nWin Rate by Confidence Score:')
-    print('Confidence | Total | Wins | Losses | Win Rate')
-    print('-' * 55)
-    for bucket, stats in confidence_buckets.items():
-        if stats['total'] > 0:
-            win_rate = (stats['win'] / stats['total']) * 100
-            print(
-                f'{bucket:10s} | {stats["total"]:5d} | {stats["win"]:4d} | {stats["lose"]:6d} | {win_rate:6.1f}%'
+    # Analysis 2: Consecutive Losses Rule - Rank analysis
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 2: CONSECUTIVE LOSSES RULE - RANK ANALYSIS')
+    out.append('=' * 80)
+
+    out.append('\nConsecutive Losses Rule - Performance by Team Rank:')
+    out.append('Rank | Total | Wins | Losses | Win Rate')
+    out.append('-' * 50)
+
+    for rank in sorted(_stat_keys(rank_outcomes)):
+        total = rank_outcomes[(rank, 'total')]
+        wins = rank_outcomes[(rank, 'win')]
+        win_rate = (wins / total) * 100 if total > 0 else 0
+        out.append(
+            STATS_ROW_TEMPLATE.format_map(
+                {
+                    'label': f'{rank:4d}',
+                    'total': total,
+                    'wins': wins,
+                    'losses': rank_outcomes[(rank, 'lose')],
+                    'win_rate': win_rate,
+                }
             )
+        )
 
-    # Analysis 4: Opponent rank difference analysis
-    print('\n' + '=' * 80)
-    print('ANALYSIS 4: OPPONENT RANK DIFFERENCE ANALYSIS (Consecutive Losses Rule)')
-    print('=' * 80)
+    # Identify bottom 3 ranks; their stats are already grouped in rank_outcomes
+    bottom_3_stats = {'win': 0, 'lose': 0, 'total': 0}
+    bottom_3_win_rate = 0.0
+    if max_rank is not None:
+        bottom_3_start = max_rank - 2
 
-    rank_diff_stats = defaultdict(lambda: {'win': 0, 'lose': 0, 'total': 0})
+        out.append(f'\nBottom 3 ranks analysis (ranks {bottom_3_start}-{max_rank}):')
 
-    for opp in consecutive_losses_opps:
-        team_analyzed = opp['team_analyzed']
-        outcome = opp['outcome']
+        # Every analyzed rank is at most max_rank, so only three ranks are read
+        for rank in range(bottom_3_start, max_rank + 1):
+            for key in bottom_3_stats:
+                bottom_3_stats[key] += rank_outcomes[(rank, key)]
 
-        try:
-            home_rank = (
-                int(opp['home_team_rank']) if opp['home_team_rank'] != 'N/A' else None
-            )
-            away_rank = (
-                int(opp['away_team_rank']) if opp['away_team_rank'] != 'N/A' else None
+        if bottom_3_stats['total'] > 0:
+            bottom_3_win_rate = (bottom_3_stats['win'] / bottom_3_stats['total']) * 100
+            out.append(f'  Total: {bottom_3_stats["total"]}')
+            out.append(f'  Wins: {bottom_3_stats["win"]} ({bottom_3_win_rate:.1f}%)')
+            out.append(
+                f'  Losses: {bottom_3_stats["lose"]} ({(100-bottom_3_win_rate):.1f}%)'
             )
 
-            if home_rank and away_rank:
-                if team_analyzed == opp['home_team']:
-                    team_rank = home_rank
-                    opponent_rank = away_rank
-                else:
-                    team_rank = away_rank
-                    opponent_rank = home_rank
-
-                rank_diff = opponent_rank - team_rank  # Positive = opponent is weaker
-
-                # Bucket the differences
-                if rank_diff <= -5:
-                    bucket = 'Opponent much stronger (-5+)'
-                elif rank_diff <= -2:
-                    bucket = 'Opponent stronger (-2 to -5)'
-                elif rank_diff <= 2:
-                    bucket = 'Similar strength (-2 to +2)'
-                elif rank_diff <= 5:
-                    bucket = 'Opponent weaker (+2 to +5)'
-                else:
-                    bucket = 'Opponent much weaker (+5+)'
-
-                rank_diff_stats[bucket]['total'] += 1
-                if outcome == 'win':
-                    rank_diff_stats[bucket]['win'] += 1
-                elif outcome == 'lose':
-                    rank_diff_stats[bucket]['lose'] += 1
-        except (ValueError, TypeError):
-            pass
-
-    print('\nWin Rate by Opponent Rank Difference:')
-    print('Rank Difference | Total | Wins | Losses | Win Rate')
-    print('-' * 60)
-    for bucket, stats in sorted(rank_diff_stats.items()):
-        if stats['total'] > 0:
-            win_rate = (stats['win'] / stats['total']) * 100
-            print(
-                f'{bucket:30s} | {stats["total"]:5d} | {stats["win"]:4d} | {stats["lose"]:6d} | {win_rate:6.1f}%'
+    write_lines(out)
+
+    # Analysis 3: Confidence score effectiveness
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 3: CONFIDENCE SCORE EFFECTIVENESS')
+    out.append('=' * 80)
+
+    out.append('\nWin Rate by Confidence Score:')
+    out.append('Confidence | Total | Wins | Losses | Win Rate')
+    out.append('-' * 55)
+    for bucket in CONFIDENCE_BUCKETS:
+        total = confidence_stats[(bucket, 'total')]
+        if total > 0:
+            wins = confidence_stats[(bucket, 'win')]
+            win_rate = (wins / total) * 100
+            out.append(
+                STATS_ROW_TEMPLATE.format_map(
+                    {
+                        'label': f'{bucket:10s}',
+                        'total': total,
+                        'wins': wins,
+                        'losses': confidence_stats[(bucket, 'lose')],
+                        'win_rate': win_rate,
+                    }
+                )
             )
 
-    # Analysis 5: Consecutive losses count analysis
-    print('\n' + '=' * 80)
-    print('ANALYSIS 5: CONSECUTIVE LOSSES COUNT ANALYSIS')
-    print('=' * 80)
+    write_lines(out)
 
-    losses_count_stats = defaultdict(lambda: {'win': 0, 'lose': 0, 'total': 0})
+    # Analysis 4: Opponent rank difference analysis
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 4: OPPONENT RANK DIFFERENCE ANALYSIS (Consecutive Losses Rule)')
+    out.append('=' * 80)
+
+    out.append('\nWin Rate by Opponent Rank Difference:')
+    out.append('Rank Difference | Total | Wins | Losses | Win Rate')
+    out.append('-' * 60)
+    for bucket in sorted(_stat_keys(rank_diff_stats)):
+        total = rank_diff_stats[(bucket, 'total')]
+        if total > 0:
+            wins = rank_diff_stats[(bucket, 'win')]
+            win_rate = (wins / total) * 100
+            out.append(
+                STATS_ROW_TEMPLATE.format_map(
+                    {
+                        'label': f'{bucket:30s}',
+                        'total': total,
+                        'wins': wins,
+                        'losses': rank_diff_stats[(bucket, 'lose')],
+                        'win_rate': win_rate,
+                    }
+                )
+            )
 
-    for opp in consecutive_losses_opps:
-        team_analyzed = opp['team_analyzed']
-        outcome = opp['outcome']
+    write_lines(out)
 
-        if team_analyzed == opp['home_team']:
-            losses = opp['home_consecutive_losses']
-        else:
-            losses = opp['away_consecutive_losses']
-
-        if losses != 'N/A':
-            try:
-                losses_int = int(losses)
-                losses_count_stats[losses_int]['total'] += 1
-                if outcome == 'win':
-                    losses_count_stats[losses_int]['win'] += 1
-                elif outcome == 'lose':
-                    losses_count_stats[losses_int]['lose'] += 1
-            except (ValueError, TypeError):
-                pass
-
-    print('\nWin Rate by Consecutive Losses Count:')
-    print('Losses | Total | Wins | Losses | Win Rate')
-    print('-' * 50)
-    for losses in sorted(losses_count_stats.keys()):
-        stats = losses_count_stats[losses]
-        win_rate = (stats['win'] / stats['total']) * 100 if stats['total'] > 0 else 0
-        print(
-            f'{losses:6d} | {stats["total"]:5d} | {stats["win"]:4d} | {stats["lose"]:6d} | {win_rate:6.1f}%'
+    # Analysis 5: Consecutive losses count analysis
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 5: CONSECUTIVE LOSSES COUNT ANALYSIS')
+    out.append('=' * 80)
+
+    out.append('\nWin Rate by Consecutive Losses Count:')
+    out.append('Losses | Total | Wins | Losses | Win Rate')
+    out.append('-' * 50)
+    for losses in sorted(_stat_keys(losses_count_stats)):
+        total = losses_count_stats[(losses, 'total')]
+        wins = losses_count_stats[(losses, 'win')]
+        win_rate = (wins / total) * 100 if total > 0 else 0
+        out.append(
+            STATS_ROW_TEMPLATE.format_map(
+                {
+                    'label': f'{losses:6d}',
+                    'total': total,
+                    'wins': wins,
+                    'losses': losses_count_stats[(losses, 'lose')],
+                    'win_rate': win_rate,
+                }
+            )
         )
 
+    write_lines(out)
+
     # Analysis 6: Live Red Card Rule analysis
-    print('\n' + '=' * 80)
-    print('ANALYSIS 6: LIVE RED CARD RULE ANALYSIS')
-    print('=' * 80)
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 6: LIVE RED CARD RULE ANALYSIS')
+    out.append('=' * 80)
 
-    live_red_card_opps = [
-        opp for opp in opportunities if opp['rule_slug'] == 'live_red_card'
-    ]
+    # Analyses 6 and 7 read their per-rule counts from rule_stats
+    live_total = rule_stats[('live_red_card', 'total')]
+    live_wins = rule_stats[('live_red_card', 'win')]
+    live_losses = rule_stats[('live_red_card', 'lose')]
 
-    print(f'\nTotal Live Red Card opportunities: {len(live_red_card_opps)}')
-    live_wins = sum(1 for opp in live_red_card_opps if opp['outcome'] == 'win')
-    live_losses = sum(1 for opp in live_red_card_opps if opp['outcome'] == 'lose')
+    out.append(f'\nTotal Live Red Card opportunities: {live_total}')
+    live_win_rate = 0.0
+    if live_total > 0:
+        live_win_rate = (live_wins / live_total) * 100
+        out.append(f'Wins: {live_wins} ({live_win_rate:.1f}%)')
+        out.append(f'Losses: {live_losses} ({(100-live_win_rate):.1f}%)')
 
-    if len(live_red_card_opps) > 0:
-        win_rate = (live_wins / len(live_red_card_opps)) * 100
-        print(f'Wins: {live_wins} ({win_rate:.1f}%)')
-        print(f'Losses: {live_losses} ({(100-win_rate):.1f}%)')
+    write_lines(out)
 
     # Analysis 7: Consecutive Draws Rule analysis
-    print('\n' + '=' * 80)
-    print('ANALYSIS 7: CONSECUTIVE DRAWS RULE ANALYSIS')
-    print('=' * 80)
+    out.append('\n' + '=' * 80)
+    out.append('ANALYSIS 7: CONSECUTIVE DRAWS RULE ANALYSIS')
+    out.append('=' * 80)
 
-    consecutive_draws_opps = [
-        opp for opp in opportunities if opp['rule_slug'] == 'consecutive_draws'
-    ]
+    draws_total = rule_stats[('consecutive_draws', 'total')]
+    draws_wins = rule_stats[('consecutive_draws', 'win')]
+    draws_losses = rule_stats[('consecutive_draws', 'lose')]
 
-    draws_wins = sum(1 for opp in consecutive_draws_opps if opp['outcome'] == 'win')
-    draws_losses = sum(1 for opp in consecutive_draws_opps if opp['outcome'] == 'lose')
+    out.append(f'\nTotal Consecutive Draws opportunities: {draws_total}')
+    if draws_total > 0:
+        win_rate = (draws_wins / draws_total) * 100
+        out.append(f'Wins: {draws_wins} ({win_rate:.1f}%)')
+        out.append(f'Losses: {draws_losses} ({(100-win_rate):.1f}%)')
 
-    print(f'\nTotal Consecutive Draws opportunities: {len(consecutive_draws_opps)}')
-    if len(consecutive_draws_opps) > 0:
-        win_rate = (draws_wins / len(consecutive_draws_opps)) * 100
-        print(f'Wins: {draws_wins} ({win_rate:.1f}%)')
-        print(f'Losses: {draws_losses} ({(100-win_rate):.1f}%)')
+    write_lines(out)
 
     # Summary and Recommendations
-    print('\n' + '=' * 80)
-    print('RECOMMENDATIONS')
-    print('=' * 80)
+    out.append('\n' + '=' * 80)
+    out.append('RECOMMENDATIONS')
+    out.append('=' * 80)
 
     recommendations = []
 
     # Recommendation 1: Filter out bottom 3 teams for Consecutive Losses Rule
-    if bottom_3_stats.get('total', 0) > 0:
-        bottom_3_win_rate = (bottom_3_stats['win'] / bottom_3_stats['total']) * 100
+    # Win rates below reuse the values computed for the report sections
+    if bottom_3_stats['total'] > 0:
         if bottom_3_win_rate < 50:
             recommendations.append(
                 f"1. CONSECUTIVE LOSSES RULE: Filter out teams in bottom 3 positions "
@@ -338,56 +539,53 @@ def analyze_betting_opportunities(csv_file: str = 'betting_opportunities_analysi
             )
 
     # Recommendation 2: Confidence score adjustments
+    low_confidence_wins = confidence_stats[('0.5', 'win')]
+    low_confidence_total = confidence_stats[('0.5', 'total')]
     low_confidence_win_rate = (
-        (confidence_buckets['0.5']['win'] / confidence_buckets['0.5']['total']) * 100
-        if confidence_buckets['0.5']['total'] > 0
+        (low_confidence_wins / low_confidence_total) * 100
+        if low_confidence_total > 0
         else 0
     )
     if low_confidence_win_rate < 50:
         recommendations.append(
             f"2. CONFIDENCE SCORE: Consider filtering out opportunities with confidence = 0.5 "
             f"(base confidence only). Current win rate: {low_confidence_win_rate:.1f}% "
-            f"({confidence_buckets['0.5']['win']}/{confidence_buckets['0.5']['total']}). "
+            f"({low_confidence_wins}/{low_confidence_total}). "
             f"These may be too weak signals."
         )
 
     # Recommendation 3: Opponent strength consideration
-    if rank_diff_stats:
-        strong_opponent_stats = rank_diff_stats.get('Opponent much stronger (-5+)', {})
-        if strong_opponent_stats.get('total', 0) > 0:
-            strong_opp_win_rate = (
-                strong_opponent_stats['win'] / strong_opponent_stats['total']
-            ) * 100
-            if strong_opp_win_rate < 50:
-                recommendations.append(
-                    f"3. OPPONENT STRENGTH: Consider filtering out matches where the team with "
-                    f"consecutive losses faces a much stronger opponent (rank difference -5 or more). "
-                    f"Current win rate: {strong_opp_win_rate:.1f}% "
-                    f"({strong_opponent_stats['win']}/{strong_opponent_stats['total']})."
-                )
+    strong_opp_total = rank_diff_stats[('Opponent much stronger (-5+)', 'total')]
+    if strong_opp_total > 0:
+        strong_opp_wins = rank_diff_stats[('Opponent much stronger (-5+)', 'win')]
+        strong_opp_win_rate = (strong_opp_wins / strong_opp_total) * 100
+        if strong_opp_win_rate < 50:
+            recommendations.append(
+                f"3. OPPONENT STRENGTH: Consider filtering out matches where the team with "
+                f"consecutive losses faces a much stronger opponent (rank difference -5 or more). "
+                f"Current win rate: {strong_opp_win_rate:.1f}% "
+                f"({strong_opp_wins}/{strong_opp_total})."
+            )
 
     # Recommendation 4: Live Red Card Rule
-    if len(live_red_card_opps) > 0:
-        live_win_rate = (live_wins / len(live_red_card_opps)) * 100
+    if live_total > 0:
         if live_win_rate < 40:
             recommendations.append(
                 f'4. LIVE RED CARD RULE: Current win rate is {live_win_rate:.1f}% '
-                f'({live_wins}/{len(live_red_card_opps)}). Consider reviewing the rule logic, '
+                f'({live_wins}/{live_total}). Consider reviewing the rule logic, '
                 f'especially regarding which team to bet on and timing considerations.'
             )
 
     # Recommendation 5: Consecutive losses count threshold
     if losses_count_stats:
-        losses_3 = losses_count_stats.get(3, {})
-        losses_4_plus = {k: v for k, v in losses_count_stats.items() if k >= 4}
-        if losses_3.get('total', 0) > 0 and losses_4_plus:
-            losses_3_win_rate = (
-                (losses_3['win'] / losses_3['total']) * 100
-                if losses_3['total'] > 0
-                else 0
+        losses_3_total = losses_count_stats[(3, 'total')]
+        losses_4_plus = [k for k in _stat_keys(losses_count_stats) if k >= 4]
+        if losses_3_total > 0 and losses_4_plus:
+            losses_3_win_rate = (losses_count_stats[(3, 'win')] / losses_3_total) * 100
+            losses_4_plus_total = sum(
+                losses_count_stats[(k, 'total')] for k in losses_4_plus
             )
-            losses_4_plus_total = sum(s['total'] for s in losses_4_plus.values())
-            losses_4_plus_wins = sum(s['win'] for s in losses_4_plus.values())
+            losses_4_plus_wins = sum(losses_count_stats[(k, 'win')] for k in losses_4_plus)
             losses_4_plus_win_rate = (
                 (losses_4_plus_wins / losses_4_plus_total) * 100
                 if losses_4_plus_total > 0
@@ -403,17 +601,15 @@ def analyze_betting_opportunities(csv_file: str = 'betting_opportunities_analysi
                 )
 
     if recommendations:
-        for i, rec in enumerate(recommendations, 1):
-            print(f'\n{rec}')
+        out.append('\n' + '\n\n'.join(recommendations))
     else:
-        print('\nNo specific recommendations based on current data patterns.')
+        out.append('\nNo specific recommendations based on current data patterns.')
 
-    print('\n' + '=' * 80)
+    out.append('\n' + '=' * 80)
+    write_lines(out)
 
 
 if __name__ == '__main__':
-    import sys
-
     csv_file = (
         sys.argv[1] if len(sys.argv) > 1 else 'betting_opportunities_analysis.csv'
     )
@@ -14,284 +14,302 @@ Usage:
 """
 
 import asyncio
-import json
-from collections import defaultdict
+from bisect import bisect_left, bisect_right
+from collections import Counter
+from collections.abc import Iterable, Sequence
+import heapq
 from typing import Any
 
 from sqlalchemy import text
 import structlog
 
 from app.bet_rules.structures import BetOutcome
-from app.db.repositories.betting_opportunity_repository import (
-    BettingOpportunityRepository,
-)
-from app.db.repositories.team_standing_repository import TeamStandingRepository
 from app.db.session import get_async_db_session
 
 
 logger = structlog.get_logger()
 
+# Rows fetched per round-trip while streaming results from the database
+STREAM_BATCH_SIZE = 1000
+
+# Bucket labels and their upper bounds; a value equal to a bound belongs to the
+# bucket the bound closes, except for confidence where bounds open a bucket
+RANK_DIFF_BUCKETS = (
+    'opponent_much_stronger',
+    'opponent_stronger',
+    'similar_rank',
+    'opponent_weaker',
+    'opponent_much_weaker',
+)
+RANK_DIFF_EDGES = (-5, -2, 2, 5)
+RANK_RANGES = ('top5', 'top10', 'mid_table', 'bottom')
+RANK_RANGE_EDGES = (5, 10, 15)
+CONFIDENCE_BUCKETS = ('low_confidence', 'medium_confidence', 'high_confidence')
+CONFIDENCE_EDGES = (0.6, 0.7)
+
+# Report labels for the bucket names above
+DISPLAY_NAMES = {
+    bucket: bucket.replace('_', ' ').title()
+    for bucket in (*RANK_DIFF_BUCKETS, *RANK_RANGES, *CONFIDENCE_BUCKETS)
+}
+
+# Report line for a group's counts: label, wins, losses, total and win rate
+STATS_LINE_TEMPLATE = '{}: {}W / {}L / {}T = {:.1f}%'
+
+# Analysis dimensions, each counted in its own (group, outcome) Counter
+STATS_DIMENSIONS = (
+    'side',
+    'rank_diff',
+    'team_rank',
+    'opponent_rank',
+    'rank_range',
+    'confidence',
+)
 
-async def analyze_consecutive_losses_rule():
-    """Analyze ConsecutiveLossesRule outcomes to identify improvement patterns."""
-    logger.info('Starting analysis of ConsecutiveLossesRule')
+# Integer buckets saturate past their outer edges, so they are precomputed for
+# every value up to one step beyond and looked up with the value clamped
+RANK_DIFF_OFFSET = 1 - RANK_DIFF_EDGES[0]
+RANK_DIFF_LOOKUP = tuple(
+    RANK_DIFF_BUCKETS[bisect_left(RANK_DIFF_EDGES, rank_diff)]
+    for rank_diff in range(-RANK_DIFF_OFFSET, RANK_DIFF_EDGES[-1] + 2)
+)
+RANK_RANGE_LOOKUP = tuple(
+    RANK_RANGES[bisect_left(RANK_RANGE_EDGES, rank)]
+    for rank in range(RANK_RANGE_EDGES[-1] + 2)
+)
 
-    async with get_async_db_session() as session:
-        opp_repo = BettingOpportunityRepository(session)
-        standing_repo = TeamStandingRepository(session)
 
-        # Get all completed opportunities for consecutive_losses rule
-        query_result = await session.execute(
-            text("""
-            SELECT
-                bo.id,
-                bo.rule_slug,
-                bo.outcome,
-                bo.details,
-                bo.confidence_score,
-                m.id as match_id,
-                m.home_score,
-                m.away_score,
-                m.season,
-                ht.id as home_team_id,
-                ht.name as home_team_name,
-                at.id as away_team_id,
-                at.name as away_team_name,
-                l.id as league_id,
-                l.name as league_name,
-                l.country
-            FROM betting_opportunity bo
-            JOIN match m ON bo.match_id = m.id
-            JOIN team ht ON m.home_team_id = ht.id
-            JOIN team at ON m.away_team_id = at.id
-            JOIN league l ON m.league_id = l.id
-            WHERE bo.rule_slug = 'consecutive_losses'
-            AND bo.outcome != 'unknown'
-            AND m.status = 'finished'
-            AND m.home_score IS NOT NULL
-            AND m.away_score IS NOT NULL
-            """)
-        )
-        rows = query_result.all()
+def _add_counts(stats: Counter, group: Any, wins: int, losses: int) -> None:
+    """Add a group's win and loss counts to a Counter keyed by (group, outcome)"""
+    stats[(group, 'wins')] += wins
+    stats[(group, 'losses')] += losses
 
-        logger.info(f'Found {len(rows)} completed opportunities for consecutive_losses rule')
 
-        # Data structures for analysis
-        home_team_stats = {'total': 0, 'wins': 0, 'losses': 0}
-        away_team_stats = {'total': 0, 'wins': 0, 'losses': 0}
+def _lookup(table: tuple[str, ...], index: int) -> str:
+    """Return a precomputed bucket, clamping the index to the table bounds"""
+    return table[min(max(index, 0), len(table) - 1)]
 
-        rank_diff_stats: dict[int, dict[str, int]] = defaultdict(
-            lambda: {'total': 0, 'wins': 0, 'losses': 0}
-        )
-        team_rank_stats: dict[int, dict[str, int]] = defaultdict(
-            lambda: {'total': 0, 'wins': 0, 'losses': 0}
-        )
-        opponent_rank_stats: dict[int, dict[str, int]] = defaultdict(
-            lambda: {'total': 0, 'wins': 0, 'losses': 0}
-        )
 
-        # Rank ranges for analysis
-        rank_range_stats: dict[str, dict[str, int]] = defaultdict(
-            lambda: {'total': 0, 'wins': 0, 'losses': 0}
-        )
+def _counts(stats: Counter, group: Any) -> tuple[int, int, int]:
+    """Return the wins, losses and total recorded for a group"""
+    wins = stats[(group, 'wins')]
+    losses = stats[(group, 'losses')]
+    return wins, losses, wins + losses
 
-        confidence_stats: dict[str, dict[str, int]] = defaultdict(
-            lambda: {'total': 0, 'wins': 0, 'losses': 0}
-        )
 
-        # Process each opportunity
-        for row in rows:
-            opp_id, rule_slug, outcome, details_json, confidence, match_id, home_score, away_score, season, home_team_id, home_team_name, away_team_id, away_team_name, league_id, league_name, country = row
-
-            # Parse details
-            try:
-                details = json.loads(details_json) if details_json else {}
-            except Exception:
-                details = {}
-
-            team_analyzed = details.get('team_analyzed', '')
-            home_rank_from_details = details.get('home_team_rank')
-            away_rank_from_details = details.get('away_team_rank')
-
-            # Get actual ranks from TeamStanding
-            home_rank = None
-            away_rank = None
-            if season:
-                home_standing = await standing_repo.get_by_team_league_season(
-                    home_team_id, league_id, season
-                )
-                away_standing = await standing_repo.get_by_team_league_season(
-                    away_team_id, league_id, season
-                )
-                if home_standing:
-                    home_rank = home_standing.rank
-                if away_standing:
-                    away_rank = away_standing.rank
-
-            # Fallback to details if standing not available
-            if home_rank is None:
-                home_rank = home_rank_from_details
-            if away_rank is None:
-                away_rank = away_rank_from_details
-
-            is_win = outcome == BetOutcome.WIN.value
-            is_loss = outcome == BetOutcome.LOSE.value
-
-            # Determine which team was analyzed
-            is_home_team = team_analyzed == home_team_name
-
-            # Home vs Away analysis
+def _aggregate_groups(rows: Iterable[Sequence[Any]], stats: dict[str, Counter]) -> int:
+    """Add a batch of grouped opportunity rows to the per-dimension Counters
+
+    Kept apart from the database access so it can be profiled or tested on its
+    own.
+
+    Args:
+        rows: (is_home_team, home_rank, away_rank, confidence, wins, total) rows
+        stats: Counters keyed by (group, 'wins' | 'losses') for STATS_DIMENSIONS
+
+    Returns:
+        Number of opportunities in the batch
+    """
+    side_stats: Counter = stats['side']
+    rank_diff_stats: Counter = stats['rank_diff']
+    team_rank_stats: Counter = stats['team_rank']
+    opponent_rank_stats: Counter = stats['opponent_rank']
+    rank_range_stats: Counter = stats['rank_range']
+    confidence_stats: Counter = stats['confidence']
+
+    # SQLite returns the comparison as 0/1, and the JSON fallback behind the
+    # ranks can yield TEXT
+    is_home_team: int
+    home_rank: Any
+    away_rank: Any
+    confidence: float | None
+    wins: int
+    total: int
+    rank_diff: Any
+    team_rank: Any
+    opponent_rank: Any
+
+    opportunities: int = 0
+    # Anything but a win counts as a loss
+    for row in rows:
+        is_home_team, home_rank, away_rank, confidence, wins, total = row
+        losses: int = total - wins
+        opportunities += total
+
+        # Home vs Away analysis
+        _add_counts(side_stats, 'home' if is_home_team else 'away', wins, losses)
+
+        # Rank difference analysis
+        if home_rank and away_rank:
             if is_home_team:
-                home_team_stats['total'] += 1
-                if is_win:
-                    home_team_stats['wins'] += 1
-                else:
-                    home_team_stats['losses'] += 1
+                rank_diff = away_rank - home_rank  # Positive = opponent is weaker
+                team_rank = home_rank
+                opponent_rank = away_rank
             else:
-                away_team_stats['total'] += 1
-                if is_win:
-                    away_team_stats['wins'] += 1
-                else:
-                    away_team_stats['losses'] += 1
-
-            # Rank difference analysis
-            if home_rank and away_rank:
-                if is_home_team:
-                    rank_diff = away_rank - home_rank  # Positive = opponent is weaker
-                    team_rank = home_rank
-                    opponent_rank = away_rank
-                else:
-                    rank_diff = home_rank - away_rank  # Positive = opponent is weaker
-                    team_rank = away_rank
-                    opponent_rank = home_rank
-
-                # Rank difference buckets
-                rank_diff_bucket = None
-                if rank_diff <= -5:
-                    rank_diff_bucket = 'opponent_much_stronger'
-                elif rank_diff <= -2:
-                    rank_diff_bucket = 'opponent_stronger'
-                elif rank_diff <= 2:
-                    rank_diff_bucket = 'similar_rank'
-                elif rank_diff <= 5:
-                    rank_diff_bucket = 'opponent_weaker'
-                else:
-                    rank_diff_bucket = 'opponent_much_weaker'
+                rank_diff = home_rank - away_rank  # Positive = opponent is weaker
+                team_rank = away_rank
+                opponent_rank = home_rank
 
-                rank_diff_stats[rank_diff_bucket]['total'] += 1
-                if is_win:
-                    rank_diff_stats[rank_diff_bucket]['wins'] += 1
-                else:
-                    rank_diff_stats[rank_diff_bucket]['losses'] += 1
-
-                # Team rank analysis
-                rank_range = None
-                if team_rank <= 5:
-                    rank_range = 'top5'
-                elif team_rank <= 10:
-                    rank_range = 'top10'
-                elif team_rank <= 15:
-                    rank_range = 'mid_table'
-                else:
-                    rank_range = 'bottom'
+            # Rank difference buckets
+            rank_diff_bucket: str = _lookup(
+                RANK_DIFF_LOOKUP, rank_diff + RANK_DIFF_OFFSET
+            )
 
-                team_rank_stats[team_rank]['total'] += 1
-                if is_win:
-                    team_rank_stats[team_rank]['wins'] += 1
-                else:
-                    team_rank_stats[team_rank]['losses'] += 1
+            _add_counts(rank_diff_stats, rank_diff_bucket, wins, losses)
 
-                rank_range_stats[rank_range]['total'] += 1
-                if is_win:
-                    rank_range_stats[rank_range]['wins'] += 1
-                else:
-                    rank_range_stats[rank_range]['losses'] += 1
-
-                # Opponent rank analysis
-                opponent_rank_range = None
-                if opponent_rank <= 5:
-                    opponent_rank_range = 'opponent_top5'
-                elif opponent_rank <= 10:
-                    opponent_rank_range = 'opponent_top10'
-                elif opponent_rank <= 15:
-                    opponent_rank_range = 'opponent_mid_table'
-                else:
-                    opponent_rank_range = 'opponent_bottom'
+            # Team rank analysis
+            rank_range: str = _lookup(RANK_RANGE_LOOKUP, team_rank)
 
-                opponent_rank_stats[opponent_rank]['total'] += 1
-                if is_win:
-                    opponent_rank_stats[opponent_rank]['wins'] += 1
-                else:
-                    opponent_rank_stats[opponent_rank]['losses'] += 1
-
-            # Confidence score analysis
-            if confidence is not None:
-                conf_bucket = None
-                if confidence < 0.6:
-                    conf_bucket = 'low_confidence'
-                elif confidence < 0.7:
-                    conf_bucket = 'medium_confidence'
-                else:
-                    conf_bucket = 'high_confidence'
+            _add_counts(team_rank_stats, team_rank, wins, losses)
+            _add_counts(rank_range_stats, rank_range, wins, losses)
+
+            # Opponent rank analysis
+            _add_counts(opponent_rank_stats, opponent_rank, wins, losses)
+
+        # Confidence score analysis
+        if confidence is not None:
+            conf_bucket: str = CONFIDENCE_BUCKETS[
+                bisect_right(CONFIDENCE_EDGES, confidence)
+            ]
+
+            _add_counts(confidence_stats, conf_bucket, wins, losses)
+
+    return opportunities
 
-                confidence_stats[conf_bucket]['total'] += 1
-                if is_win:
-                    confidence_stats[conf_bucket]['wins'] += 1
-                else:
-                    confidence_stats[conf_bucket]['losses'] += 1
 
-        # Print analysis results
+async def analyze_consecutive_losses_rule():
+    """Analyze ConsecutiveLossesRule outcomes to identify improvement patterns."""
+    logger.info('Starting analysis of ConsecutiveLossesRule')
+
+    async with get_async_db_session() as session:
+        # Count completed consecutive_losses opportunities in the database, grouped
+        # by everything the analysis buckets on, so only one row per distinct
+        # (side, ranks, confidence) combination reaches Python. Ranks come from
+        # the joined season standings (uq_team_league_season backs the join),
+        # falling back to the ones stored in valid details JSON.
+        query_result = await session.stream(
+            text("""
+            WITH opportunities AS (
+                SELECT
+                    bo.outcome,
+                    bo.confidence_score,
+                    ht.name as home_team_name,
+                    hs.rank as home_rank_db,
+                    aws.rank as away_rank_db,
+                    CASE WHEN json_valid(bo.details) THEN bo.details END as details
+                FROM betting_opportunity bo
+                JOIN match m ON bo.match_id = m.id
+                JOIN team ht ON m.home_team_id = ht.id
+                LEFT JOIN team_standing hs ON hs.team_id = m.home_team_id
+                    AND hs.league_id = m.league_id AND hs.season = m.season
+                LEFT JOIN team_standing aws ON aws.team_id = m.away_team_id
+                    AND aws.league_id = m.league_id AND aws.season = m.season
+                WHERE bo.rule_slug = 'consecutive_losses'
+                AND bo.outcome != 'unknown'
+                AND m.status = 'finished'
+                AND m.home_score IS NOT NULL
+                AND m.away_score IS NOT NULL
+            ),
+            extracted AS (
+                SELECT
+                    outcome,
+                    confidence_score,
+                    home_team_name,
+                    home_rank_db,
+                    away_rank_db,
+                    json_extract(details, '$.team_analyzed') as team_analyzed,
+                    json_extract(details, '$.home_team_rank') as home_rank_details,
+                    json_extract(details, '$.away_team_rank') as away_rank_details
+                FROM opportunities
+            )
+            SELECT
+                COALESCE(team_analyzed, '') = home_team_name as is_home_team,
+                COALESCE(home_rank_db, home_rank_details) as home_rank,
+                COALESCE(away_rank_db, away_rank_details) as away_rank,
+                confidence_score,
+                COUNT(*) FILTER (WHERE outcome = :win) as wins,
+                COUNT(*) as total
+            FROM extracted
+            GROUP BY 1, 2, 3, 4
+            """).execution_options(yield_per=STREAM_BATCH_SIZE),
+            {'win': BetOutcome.WIN.value},
+        )
+
+        # Aggregate the grouped rows batch by batch as they arrive
+        stats = {dimension: Counter() for dimension in STATS_DIMENSIONS}
+        total_rows = 0
+        async for partition in query_result.partitions():
+            total_rows += _aggregate_groups(partition, stats)
+
+        side_stats = stats['side']
+        rank_diff_stats = stats['rank_diff']
+        team_rank_stats = stats['team_rank']
+        rank_range_stats = stats['rank_range']
+        confidence_stats = stats['confidence']
+
+        logger.info(f'Found {total_rows} completed opportunities for consecutive_losses rule')
+
+        # Print analysis results; every stats line shares one bound format
+        format_stats = STATS_LINE_TEMPLATE.format
         print('\n' + '=' * 80)
         print('CONSECUTIVE LOSSES RULE ANALYSIS')
         print('=' * 80)
 
         # Home vs Away
         print('\n--- Home Team vs Away Team Performance ---')
-        if home_team_stats['total'] > 0:
-            home_win_rate = (home_team_stats['wins'] / home_team_stats['total']) * 100
-            print(f'Home Team: {home_team_stats["wins"]}W / {home_team_stats["losses"]}L / {home_team_stats["total"]}T = {home_win_rate:.1f}%')
-        if away_team_stats['total'] > 0:
-            away_win_rate = (away_team_stats['wins'] / away_team_stats['total']) * 100
-            print(f'Away Team: {away_team_stats["wins"]}W / {away_team_stats["losses"]}L / {away_team_stats["total"]}T = {away_win_rate:.1f}%')
+        home_wins, home_losses, home_total = _counts(side_stats, 'home')
+        away_wins, away_losses, away_total = _counts(side_stats, 'away')
+        if home_total > 0:
+            home_win_rate = (home_wins / home_total) * 100
+            print(format_stats('Home Team', home_wins, home_losses, home_total, home_win_rate))
+        if away_total > 0:
+            away_win_rate = (away_wins / away_total) * 100
+            print(format_stats('Away Team', away_wins, away_losses, away_total, away_win_rate))
 
         # Rank difference analysis
         print('\n--- Rank Difference Analysis (Team Rank - Opponent Rank) ---')
-        for bucket in ['opponent_much_stronger', 'opponent_stronger', 'similar_rank', 'opponent_weaker', 'opponent_much_weaker']:
-            stats = rank_diff_stats[bucket]
-            if stats['total'] > 0:
-                win_rate = (stats['wins'] / stats['total']) * 100
-                print(f'{bucket.replace("_", " ").title()}: {stats["wins"]}W / {stats["losses"]}L / {stats["total"]}T = {win_rate:.1f}%')
+        for bucket in RANK_DIFF_BUCKETS:
+            wins, losses, total = _counts(rank_diff_stats, bucket)
+            if total > 0:
+                win_rate = (wins / total) * 100
+                print(format_stats(DISPLAY_NAMES[bucket], wins, losses, total, win_rate))
 
         # Team rank range analysis
         print('\n--- Team Rank Range Analysis ---')
-        for rank_range in ['top5', 'top10', 'mid_table', 'bottom']:
-            stats = rank_range_stats[rank_range]
-            if stats['total'] > 0:
-                win_rate = (stats['wins'] / stats['total']) * 100
-                print(f'{rank_range.replace("_", " ").title()}: {stats["wins"]}W / {stats["losses"]}L / {stats["total"]}T = {win_rate:.1f}%')
-
-        # Individual team rank analysis (top and bottom)
+        for rank_range in RANK_RANGES:
+            wins, losses, total = _counts(rank_range_stats, rank_range)
+            if total > 0:
+                win_rate = (wins / total) * 100
+                print(format_stats(DISPLAY_NAMES[rank_range], wins, losses, total, win_rate))
+
+        # Individual team rank analysis (top and bottom) over ranks with at least
+        # 10 opportunities; each win rate is computed once
+        rank_rates = []
+        for rank in sorted({rank for rank, _ in team_rank_stats}):
+            wins, losses, total = _counts(team_rank_stats, rank)
+            if total >= 10:
+                rank_rates.append((rank, wins, losses, total, (wins / total) * 100))
+
+        # Equal win rates list the better (lower) rank first in both sections
         print('\n--- Individual Team Rank Analysis (Top Performers) ---')
-        sorted_ranks = sorted([(rank, stats) for rank, stats in team_rank_stats.items() if stats['total'] >= 10],
-                            key=lambda x: (x[1]['wins'] / x[1]['total'] if x[1]['total'] > 0 else 0), reverse=True)
-        for rank, stats in sorted_ranks[:10]:
-            win_rate = (stats['wins'] / stats['total']) * 100
-            print(f'Rank {rank}: {stats["wins"]}W / {stats["losses"]}L / {stats["total"]}T = {win_rate:.1f}%')
+        for rank, wins, losses, total, win_rate in heapq.nlargest(
+            10, rank_rates, key=lambda rate: (rate[4], -rate[0])
+        ):
+            print(format_stats(f'Rank {rank}', wins, losses, total, win_rate))
 
         print('\n--- Individual Team Rank Analysis (Bottom Performers) ---')
-        sorted_ranks_bottom = sorted([(rank, stats) for rank, stats in team_rank_stats.items() if stats['total'] >= 10],
-                                    key=lambda x: (x[1]['wins'] / x[1]['total'] if x[1]['total'] > 0 else 0))
-        for rank, stats in sorted_ranks_bottom[:10]:
-            win_rate = (stats['wins'] / stats['total']) * 100
-            print(f'Rank {rank}: {stats["wins"]}W / {stats["losses"]}L / {stats["total"]}T = {win_rate:.1f}%')
+        for rank, wins, losses, total, win_rate in heapq.nsmallest(
+            10, rank_rates, key=lambda rate: (rate[4], rate[0])
+        ):
+            print(format_stats(f'Rank {rank}', wins, losses, total, win_rate))
 
         # Confidence analysis
         print('\n--- Confidence Score Analysis ---')
-        for conf_bucket in ['low_confidence', 'medium_confidence', 'high_confidence']:
-            stats = confidence_stats[conf_bucket]
-            if stats['total'] > 0:
-                win_rate = (stats['wins'] / stats['total']) * 100
-                print(f'{conf_bucket.replace("_", " ").title()}: {stats["wins"]}W / {stats["losses"]}L / {stats["total"]}T = {win_rate:.1f}%')
+        for conf_bucket in CONFIDENCE_BUCKETS:
+            wins, losses, total = _counts(confidence_stats, conf_bucket)
+            if total > 0:
+                win_rate = (wins / total) * 100
+                print(format_stats(DISPLAY_NAMES[conf_bucket], wins, losses, total, win_rate))
 
         print('\n' + '=' * 80)
         print('RECOMMENDATIONS')
@@ -300,9 +318,7 @@ async def analyze_consecutive_losses_rule():
         # Generate recommendations
         recommendations = []
 
-        if home_team_stats['total'] > 0 and away_team_stats['total'] > 0:
-            home_win_rate = (home_team_stats['wins'] / home_team_stats['total']) * 100
-            away_win_rate = (away_team_stats['wins'] / away_team_stats['total']) * 100
+        if home_total > 0 and away_total > 0:
             if abs(home_win_rate - away_win_rate) > 5:
                 if home_win_rate > away_win_rate:
                     recommendations.append(f'Home teams perform better ({home_win_rate:.1f}% vs {away_win_rate:.1f}%). Consider favoring home teams.')
@@ -310,25 +326,29 @@ async def analyze_consecutive_losses_rule():
                     recommendations.append(f'Away teams perform better ({away_win_rate:.1f}% vs {home_win_rate:.1f}%). Consider favoring away teams.')
 
         # Check rank difference patterns
-        if rank_diff_stats['opponent_much_weaker']['total'] > 0:
-            win_rate = (rank_diff_stats['opponent_much_weaker']['wins'] / rank_diff_stats['opponent_much_weaker']['total']) * 100
+        wins, _, total = _counts(rank_diff_stats, 'opponent_much_weaker')
+        if total > 0:
+            win_rate = (wins / total) * 100
             if win_rate > 65:
                 recommendations.append(f'Strong performance when opponent is much weaker ({win_rate:.1f}%). This is good.')
 
-        if rank_diff_stats['opponent_much_stronger']['total'] > 0:
-            win_rate = (rank_diff_stats['opponent_much_stronger']['wins'] / rank_diff_stats['opponent_much_stronger']['total']) * 100
+        wins, _, total = _counts(rank_diff_stats, 'opponent_much_stronger')
+        if total > 0:
+            win_rate = (wins / total) * 100
             if win_rate < 50:
                 recommendations.append(f'Weak performance when opponent is much stronger ({win_rate:.1f}%). Consider excluding these cases.')
 
         # Check bottom teams
-        if rank_range_stats['bottom']['total'] > 0:
-            win_rate = (rank_range_stats['bottom']['wins'] / rank_range_stats['bottom']['total']) * 100
+        wins, _, total = _counts(rank_range_stats, 'bottom')
+        if total > 0:
+            win_rate = (wins / total) * 100
             if win_rate < 55:
                 recommendations.append(f'Bottom teams have low win rate ({win_rate:.1f}%). Consider excluding bottom 3-5 teams.')
 
         # Check top teams
-        if rank_range_stats['top5']['total'] > 0:
-            win_rate = (rank_range_stats['top5']['wins'] / rank_range_stats['top5']['total']) * 100
+        wins, _, total = _counts(rank_range_stats, 'top5')
+        if total > 0:
+            win_rate = (wins / total) * 100
             if win_rate > 70:
                 recommendations.append(f'Top 5 teams perform well ({win_rate:.1f}%). This is good.')
 
@@ -20,8 +20,12 @@ Usage:
 
 import argparse
 import asyncio
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from datetime import datetime
 from typing import Any
 
+from pydantic import TypeAdapter
 import structlog
 from app.bet_rules.bet_rules import (
     ConsecutiveDrawsRule,
@@ -30,18 +34,23 @@ from app.bet_rules.bet_rules import (
     Top5ConsecutiveNoWinsRule,
 )
 from app.bet_rules.rule_engine import BettingRulesEngine
-from app.bet_rules.structures import MatchSummary
+from app.bet_rules.structures import MatchData, MatchSummary
 from app.db.repositories.betting_opportunity_repository import (
     BettingOpportunityRepository,
 )
 from app.db.repositories.match_repository import MatchRepository
 from app.db.repositories.team_standing_repository import TeamStandingRepository
 from app.db.session import get_async_db_session
+from app.db.sqlalchemy_models import League
 from app.scraper.constants import LEAGUES_OF_INTEREST
+from app.scripts.utils import write_lines
 
 
 logger = structlog.get_logger()
 
+# Leagues analyzed at the same time by analyze_all_leagues
+MAX_CONCURRENT_LEAGUES = 4
+
 rules = [
     ConsecutiveLossesRule(),
     ConsecutiveDrawsRule(),
@@ -49,6 +58,59 @@ rules = [
     Top5ConsecutiveNoWinsRule(),
 ]
 
+# Validates a team's recent matches in one call instead of one model per row
+_RECENT_MATCHES_ADAPTER = TypeAdapter(list[MatchData])
+
+# Fewest previous matches any rule needs (Top5ConsecutiveLossesRule: 2 losses)
+MIN_RULE_HISTORY = 2
+
+# Rule evaluation keeps no per-match state, so one engine serves every league
+rules_engine = BettingRulesEngine(rules=rules)
+
+
+async def _get_betting_statistics(season: int | None) -> dict[str, Any]:
+    """Fetch overall, by-type, by-rule and by-period betting statistics.
+
+    The four queries run concurrently, each in its own session since a session
+    runs one operation at a time.
+
+    Args:
+        season: Season year (e.g., 2024). If None, statistics cover all seasons.
+
+    Returns:
+        Dictionary with season_statistics, season_statistics_by_type,
+        season_statistics_by_rule and season_statistics_by_period
+    """
+
+    async def fetch(
+        query: Callable[[BettingOpportunityRepository], Awaitable[Any]],
+    ) -> Any:
+        async with get_async_db_session() as session:
+            return await query(BettingOpportunityRepository(session))
+
+    season_stats, stats_by_type, stats_by_rule, stats_by_period = (
+        await asyncio.gather(
+            fetch(lambda repo: repo.get_betting_statistics(season=season)),
+            fetch(
+                lambda repo: repo.get_betting_statistics_by_opportunity_type(
+                    season=season
+                )
+            ),
+            fetch(lambda repo: repo.get_betting_statistics_by_rule(season=season)),
+            fetch(
+                lambda repo: repo.get_betting_statistics_by_season_period(
+                    season=season
+                )
+            ),
+        )
+    )
+    return {
+        'season_statistics': season_stats,
+        'season_statistics_by_type': stats_by_type,
+        'season_statistics_by_rule': stats_by_rule,
+        'season_statistics_by_period': stats_by_period,
+    }
+
 
 async def analyze_historical_matches(
     country: str,
@@ -56,6 +118,8 @@ async def analyze_historical_matches(
     season: int | None,
     start_round: int = 6,
     rounds_back: int = 5,
+    with_statistics: bool = True,
+    league: League | None = None,
 ) -> dict[str, Any]:
     """Analyze historical matches and create betting opportunities.
 
@@ -65,6 +129,8 @@ async def analyze_historical_matches(
         season: Season year (e.g., 2024). If None, only statistics are calculated.
         start_round: Starting round number (default: 6)
         rounds_back: Number of previous rounds to use for analysis (default: 5)
+        with_statistics: Fetch season betting statistics after the analysis
+        league: Already loaded league, looked up by name and country if None
 
     Returns:
         Dictionary with statistics about the analysis
@@ -92,39 +158,19 @@ async def analyze_historical_matches(
             country=country,
             league=league_name,
         )
-        async with get_async_db_session() as stats_session:
-            stats_opp_repo = BettingOpportunityRepository(stats_session)
-            season_stats = await stats_opp_repo.get_betting_statistics(season=None)
-            stats_by_type = (
-                await stats_opp_repo.get_betting_statistics_by_opportunity_type(
-                    season=None
-                )
-            )
-            stats_by_rule = await stats_opp_repo.get_betting_statistics_by_rule(
-                season=None
-            )
-            stats_by_period = (
-                await stats_opp_repo.get_betting_statistics_by_season_period(
-                    season=None
-                )
-            )
-            stats['season_statistics'] = season_stats
-            stats['season_statistics_by_type'] = stats_by_type
-            stats['season_statistics_by_rule'] = stats_by_rule
-            stats['season_statistics_by_period'] = stats_by_period
+        stats.update(await _get_betting_statistics(season=None))
         return stats
 
-    rules_engine = BettingRulesEngine(rules=rules)
-
     async with get_async_db_session() as session:
         match_repo = MatchRepository(session)
         opp_repo = BettingOpportunityRepository(session)
         standing_repo = TeamStandingRepository(session)
 
         # Get league
-        league = await match_repo.get_league_by_name_and_country(
-            league_name, country
-        )
+        if league is None:
+            league = await match_repo.get_league_by_name_and_country(
+                league_name, country
+            )
         if not league:
             logger.error(f'League not found: {country} - {league_name}')
             return stats
@@ -149,14 +195,26 @@ async def analyze_historical_matches(
             f'Processing rounds {start_round} to {max_round} for {country} - {league_name} season {season}'
         )
 
+        # Get team ranks and teams count from TeamStanding once for the season
+        # (teams count is more accurate than league.teams and avoids lazy loading)
+        standings = await standing_repo.get_standings_by_league_season(
+            league.id, season
+        )
+        team_ranks = {standing.team_id: standing.rank for standing in standings}
+        teams_count = len(standings)
+
+        # Get all matches from start_round onwards in one query, grouped by round
+        matches_by_round: defaultdict[int, list] = defaultdict(list)
+        for match in await match_repo.get_matches_by_league_season_from_round(
+            league.id, season, start_round
+        ):
+            matches_by_round[match.round].append(match)
+
         # Iterate through rounds from start_round to max_round
         for round_num in range(start_round, max_round + 1):
             logger.info(f'Processing Round {round_num}')
 
-            # Get all matches for this round
-            round_matches = await match_repo.get_matches_by_league_season_round(
-                league.id, season, round_num
-            )
+            round_matches = matches_by_round.get(round_num)
 
             if not round_matches:
                 logger.warning(f'No matches found for Round {round_num}')
@@ -165,51 +223,48 @@ async def analyze_historical_matches(
             logger.info(f'Found {len(round_matches)} matches in Round {round_num}')
 
             round_opportunities = 0
+            round_bets = []
+
+            # Get recent matches for every team before its match's date in one query
+            # This handles cases where matches from higher rounds may be played earlier
+            before_dates: dict[int, datetime] = {}
+            for match in round_matches:
+                before_dates.setdefault(match.home_team.id, match.match_date)
+                before_dates.setdefault(match.away_team.id, match.match_date)
+            round_recent_matches = await match_repo.get_recent_matches_for_teams(
+                before_dates, season, limit=rounds_back
+            )
+
+            async def get_recent_matches(team_id: int, before_date: datetime) -> list:
+                """Prefetched recent matches, or a lookup for a team's second match"""
+                if before_dates[team_id] == before_date:
+                    return round_recent_matches[team_id]
+                return await match_repo.get_team_matches_by_season_and_rounds(
+                    team_id, season, before_date=before_date, limit=rounds_back
+                )
 
             # Analyze each match in this round
             for match in round_matches:
                 try:
-                    # Get recent matches for both teams before this match's date
-                    # This handles cases where matches from higher rounds may be played earlier
-                    home_recent_matches = (
-                        await match_repo.get_team_matches_by_season_and_rounds(
-                            match.home_team.id,
-                            season,
-                            before_date=match.match_date,
-                            limit=rounds_back,
-                        )
+                    home_recent_matches = await get_recent_matches(
+                        match.home_team.id, match.match_date
                     )
-                    away_recent_matches = (
-                        await match_repo.get_team_matches_by_season_and_rounds(
-                            match.away_team.id,
-                            season,
-                            before_date=match.match_date,
-                            limit=rounds_back,
-                        )
+                    away_recent_matches = await get_recent_matches(
+                        match.away_team.id, match.match_date
                     )
 
-                    # Get team ranks from TeamStanding
-                    home_rank = None
-                    away_rank = None
-                    home_standing = await standing_repo.get_by_team_league_season(
-                        match.home_team.id, league.id, season
-                    )
-                    away_standing = await standing_repo.get_by_team_league_season(
-                        match.away_team.id, league.id, season
-                    )
-                    if home_standing:
-                        home_rank = home_standing.rank
-                    if away_standing:
-                        away_rank = away_standing.rank
+                    # No rule can fire without a long enough streak for either team
+                    if (
+                        len(home_recent_matches) < MIN_RULE_HISTORY
+                        and len(away_recent_matches) < MIN_RULE_HISTORY
+                    ):
+                        stats['total_matches_analyzed'] += 1
+                        continue
 
-                    logger.info(f'Home rank: {home_rank}, Away rank: {away_rank}')
+                    home_rank = team_ranks.get(match.home_team.id)
+                    away_rank = team_ranks.get(match.away_team.id)
 
-                    # Get teams count from TeamStanding for this season (more accurate than league.teams)
-                    # This avoids lazy loading issues
-                    teams_count_result = await standing_repo.get_standings_by_league_season(
-                        league.id, season
-                    )
-                    teams_count = len(teams_count_result) if teams_count_result else 0
+                    logger.debug('Team ranks', home_rank=home_rank, away_rank=away_rank)
 
                     # Create MatchSummary with teams_count to avoid lazy loading
                     try:
@@ -221,8 +276,12 @@ async def analyze_historical_matches(
                         continue
 
                     # Convert recent matches to Pydantic models
-                    home_matches_data = [m.to_pydantic() for m in home_recent_matches]
-                    away_matches_data = [m.to_pydantic() for m in away_recent_matches]
+                    home_matches_data = _RECENT_MATCHES_ADAPTER.validate_python(
+                        [m.to_dict() for m in home_recent_matches]
+                    )
+                    away_matches_data = _RECENT_MATCHES_ADAPTER.validate_python(
+                        [m.to_dict() for m in away_recent_matches]
+                    )
 
                     match_summary.home_recent_matches = home_matches_data
                     match_summary.away_recent_matches = away_matches_data
@@ -230,25 +289,18 @@ async def analyze_historical_matches(
                     # Analyze match using rules engine
                     match_opportunities = rules_engine.analyze_match(match_summary)
 
-                    logger.info(f'Match opportunities: {match_opportunities}')
-
-                    if match_opportunities:
-                        # Save opportunities
-                        for opp in match_opportunities:
-                            try:
-                                await opp_repo.save_opportunity(opp)
-                                round_opportunities += 1
-                                stats['total_opportunities_created'] += 1
-                                logger.debug(
-                                    f'Created opportunity: {opp.slug} for '
-                                    f'{match.home_team.name} vs {match.away_team.name}'
-                                )
-                            except Exception as e:
-                                logger.error(
-                                    f'Error saving opportunity: {e}',
-                                    match_id=match.id,
-                                    rule_slug=opp.slug,
-                                )
+                    logger.debug(
+                        'Match opportunities',
+                        match_id=match.id,
+                        rules=[opp.slug for opp in match_opportunities],
+                    )
+
+                    for opp in match_opportunities:
+                        round_bets.append(opp)
+                        # Saved with the rest of the round below
+                        logger.debug(
+                            'Queued opportunity', rule=opp.slug, match_id=match.id
+                        )
 
                     stats['total_matches_analyzed'] += 1
 
@@ -259,6 +311,14 @@ async def analyze_historical_matches(
                     )
                     continue
 
+            # Save the whole round's opportunities in one transaction
+            try:
+                await opp_repo.save_opportunities(round_bets)
+                round_opportunities = len(round_bets)
+                stats['total_opportunities_created'] += round_opportunities
+            except Exception as e:
+                logger.error(f'Error saving opportunities: {e}', round_num=round_num)
+
             stats['opportunities_by_round'][round_num] = round_opportunities
             stats['total_rounds_processed'] += 1
 
@@ -268,43 +328,24 @@ async def analyze_historical_matches(
             )
 
         # After processing all rounds, update betting outcomes for finished matches
-        # Use a fresh session to avoid async context issues
+        # save_opportunities rolls back a round that fails to commit, so the
+        # analysis session is still usable here
         try:
-            async with get_async_db_session() as update_session:
-                update_opp_repo = BettingOpportunityRepository(update_session)
-                updated_outcomes = await update_opp_repo.update_betting_outcomes()
-                stats['updated_outcomes'] = updated_outcomes
-                logger.info(
-                    'Updated betting outcomes after historical analysis',
-                    updated_outcomes=updated_outcomes,
-                )
+            updated_outcomes = await opp_repo.update_betting_outcomes()
+            stats['updated_outcomes'] = updated_outcomes
+            logger.info(
+                'Updated betting outcomes after historical analysis',
+                updated_outcomes=updated_outcomes,
+            )
         except Exception as e:
             logger.error(f'Error updating betting outcomes: {e}')
             stats['updated_outcomes'] = 0
 
         # Get betting statistics for the specified season
-        # Use a fresh session to avoid async context issues
-        try:
-            async with get_async_db_session() as stats_session:
-                stats_opp_repo = BettingOpportunityRepository(stats_session)
-                season_stats = await stats_opp_repo.get_betting_statistics(season=season)
-                stats_by_type = (
-                    await stats_opp_repo.get_betting_statistics_by_opportunity_type(
-                        season=season
-                    )
-                )
-                stats_by_rule = await stats_opp_repo.get_betting_statistics_by_rule(
-                    season=season
-                )
-                stats_by_period = (
-                    await stats_opp_repo.get_betting_statistics_by_season_period(
-                        season=season
-                    )
-                )
-                stats['season_statistics'] = season_stats
-                stats['season_statistics_by_type'] = stats_by_type
-                stats['season_statistics_by_rule'] = stats_by_rule
-                stats['season_statistics_by_period'] = stats_by_period
+        if with_statistics:
+            try:
+                stats.update(await _get_betting_statistics(season=season))
+                season_stats = stats['season_statistics']
                 logger.info(
                     f'Betting statistics for {season} season',
                     total=season_stats['total'],
@@ -314,14 +355,16 @@ async def analyze_historical_matches(
                 )
                 logger.info(
                     f'Betting statistics by opportunity type for {season} season',
-                    stats_by_type=stats_by_type,
+                    stats_by_type=stats['season_statistics_by_type'],
                 )
-        except Exception as e:
-            logger.error(f'Error getting betting statistics for {season} season: {e}')
-            stats['season_statistics'] = None
-            stats['season_statistics_by_type'] = None
-            stats['season_statistics_by_rule'] = None
-            stats['season_statistics_by_period'] = None
+            except Exception as e:
+                logger.error(
+                    f'Error getting betting statistics for {season} season: {e}'
+                )
+                stats['season_statistics'] = None
+                stats['season_statistics_by_type'] = None
+                stats['season_statistics_by_rule'] = None
+                stats['season_statistics_by_period'] = None
 
     logger.info(
         'Historical match analysis completed',
@@ -333,93 +376,6 @@ async def analyze_historical_matches(
     return stats
 
 
-def _merge_statistics(
-    stats_list: list[dict[str, Any]]
-) -> dict[str, dict[str, int | float]]:
-    """Merge statistics from multiple leagues.
-
-    Args:
-        stats_list: List of statistics dictionaries from multiple leagues
-
-    Returns:
-        Merged statistics dictionary
-    """
-    merged: dict[str, dict[str, int | float]] = {}
-
-    for stats in stats_list:
-        # Merge overall statistics
-        if 'season_statistics' in stats and stats['season_statistics']:
-            if 'overall' not in merged:
-                merged['overall'] = {
-                    'total': 0,
-                    'wins': 0,
-                    'losses': 0,
-                    'win_rate': 0.0,
-                }
-            merged['overall']['total'] += stats['season_statistics']['total']
-            merged['overall']['wins'] += stats['season_statistics']['wins']
-            merged['overall']['losses'] += stats['season_statistics']['losses']
-
-        # Merge statistics by opportunity type
-        if 'season_statistics_by_type' in stats and stats['season_statistics_by_type']:
-            if 'by_type' not in merged:
-                merged['by_type'] = {}
-            for opp_type, type_stats in stats['season_statistics_by_type'].items():
-                if opp_type not in merged['by_type']:
-                    merged['by_type'][opp_type] = {
-                        'total': 0,
-                        'wins': 0,
-                        'losses': 0,
-                        'win_rate': 0.0,
-                    }
-                merged['by_type'][opp_type]['total'] += type_stats['total']
-                merged['by_type'][opp_type]['wins'] += type_stats['wins']
-                merged['by_type'][opp_type]['losses'] += type_stats['losses']
-
-        # Merge statistics by rule
-        if 'season_statistics_by_rule' in stats and stats['season_statistics_by_rule']:
-            if 'by_rule' not in merged:
-                merged['by_rule'] = {}
-            for rule_slug, rule_stats in stats['season_statistics_by_rule'].items():
-                if rule_slug not in merged['by_rule']:
-                    merged['by_rule'][rule_slug] = {
-                        'rule_name': rule_stats.get('rule_name', rule_slug),
-                        'total': 0,
-                        'wins': 0,
-                        'losses': 0,
-                        'win_rate': 0.0,
-                    }
-                merged['by_rule'][rule_slug]['total'] += rule_stats['total']
-                merged['by_rule'][rule_slug]['wins'] += rule_stats['wins']
-                merged['by_rule'][rule_slug]['losses'] += rule_stats['losses']
-
-    # Calculate win rates
-    if 'overall' in merged:
-        total = merged['overall']['total']
-        wins = merged['overall']['wins']
-        merged['overall']['win_rate'] = round(
-            (wins / total * 100) if total > 0 else 0.0, 1
-        )
-
-    if 'by_type' in merged:
-        for opp_type in merged['by_type']:
-            total = merged['by_type'][opp_type]['total']
-            wins = merged['by_type'][opp_type]['wins']
-            merged['by_type'][opp_type]['win_rate'] = round(
-                (wins / total * 100) if total > 0 else 0.0, 1
-            )
-
-    if 'by_rule' in merged:
-        for rule_slug in merged['by_rule']:
-            total = merged['by_rule'][rule_slug]['total']
-            wins = merged['by_rule'][rule_slug]['wins']
-            merged['by_rule'][rule_slug]['win_rate'] = round(
-                (wins / total * 100) if total > 0 else 0.0, 1
-            )
-
-    return merged
-
-
 async def analyze_all_leagues(
     season: int | None = None,
     start_round: int = 6,
@@ -445,100 +401,88 @@ async def analyze_all_leagues(
     # If season is None, only get statistics for all seasons
     if season is None:
         logger.info('Season not provided, calculating statistics for all seasons')
-        async with get_async_db_session() as stats_session:
-            stats_opp_repo = BettingOpportunityRepository(stats_session)
-            season_stats = await stats_opp_repo.get_betting_statistics(season=None)
-            stats_by_type = (
-                await stats_opp_repo.get_betting_statistics_by_opportunity_type(
-                    season=None
-                )
-            )
-            stats_by_rule = await stats_opp_repo.get_betting_statistics_by_rule(
-                season=None
-            )
-            stats_by_period = (
-                await stats_opp_repo.get_betting_statistics_by_season_period(
-                    season=None
-                )
-            )
-            return {
-                'total_rounds_processed': 0,
-                'total_matches_analyzed': 0,
-                'total_opportunities_created': 0,
-                'season_statistics': season_stats,
-                'season_statistics_by_type': stats_by_type,
-                'season_statistics_by_rule': stats_by_rule,
-                'season_statistics_by_period': stats_by_period,
-                'leagues_processed': 0,
-            }
+        return {
+            'total_rounds_processed': 0,
+            'total_matches_analyzed': 0,
+            'total_opportunities_created': 0,
+            **await _get_betting_statistics(season=None),
+            'leagues_processed': 0,
+        }
 
     all_stats = []
     total_rounds = 0
     total_matches = 0
     total_opportunities = 0
 
-    # Iterate over all countries and leagues
-    for country_enum, league_enums in LEAGUES_OF_INTEREST.items():
-        country = country_enum.value
-        for league_enum in league_enums:
-            league_name = league_enum.value
+    semaphore = asyncio.Semaphore(MAX_CONCURRENT_LEAGUES)
+
+    async def analyze_league(country: str, league_name: str) -> dict[str, Any]:
+        async with semaphore:
             logger.info(
                 f'Processing {country} - {league_name}',
                 country=country,
                 league=league_name,
             )
+            return await analyze_historical_matches(
+                country=country,
+                league_name=league_name,
+                season=season,
+                start_round=start_round,
+                rounds_back=rounds_back,
+                with_statistics=False,
+                league=leagues_by_name.get((league_name, country)),
+            )
 
-            try:
-                league_stats = await analyze_historical_matches(
-                    country=country,
-                    league_name=league_name,
-                    season=season,
-                    start_round=start_round,
-                    rounds_back=rounds_back,
-                )
-                all_stats.append(league_stats)
+    # Analyze all countries and leagues, a few at a time; each league opens its
+    # own sessions
+    leagues = [
+        (country_enum.value, league_enum.value)
+        for country_enum, league_enums in LEAGUES_OF_INTEREST.items()
+        for league_enum in league_enums
+    ]
+    # Look up every league in one query instead of one per league
+    async with get_async_db_session() as session:
+        match_repo = MatchRepository(session)
+        leagues_by_name = await match_repo.get_leagues_by_names_and_countries(
+            [(league_name, country) for country, league_name in leagues]
+        )
 
-                # Aggregate processing statistics
-                total_rounds += league_stats.get('total_rounds_processed', 0)
-                total_matches += league_stats.get('total_matches_analyzed', 0)
-                total_opportunities += league_stats.get(
-                    'total_opportunities_created', 0
-                )
+    results = await asyncio.gather(
+        *(analyze_league(country, league_name) for country, league_name in leagues),
+        return_exceptions=True,
+    )
 
-                logger.info(
-                    f'Completed {country} - {league_name}',
-                    rounds=league_stats.get('total_rounds_processed', 0),
-                    matches=league_stats.get('total_matches_analyzed', 0),
-                    opportunities=league_stats.get('total_opportunities_created', 0),
-                )
-            except Exception as e:
-                logger.error(
-                    f'Error processing {country} - {league_name}: {e}',
-                    country=country,
-                    league=league_name,
-                )
-                continue
+    for (country, league_name), league_stats in zip(leagues, results, strict=True):
+        if isinstance(league_stats, BaseException):
+            logger.error(
+                f'Error processing {country} - {league_name}: {league_stats}',
+                country=country,
+                league=league_name,
+            )
+            continue
 
-    # Merge statistics from all leagues
-    merged_stats = _merge_statistics(all_stats)
+        all_stats.append(league_stats)
 
-    # Get statistics by period (aggregated across all leagues)
-    async with get_async_db_session() as period_session:
-        period_opp_repo = BettingOpportunityRepository(period_session)
-        stats_by_period = (
-            await period_opp_repo.get_betting_statistics_by_season_period(
-                season=season
-            )
+        # Aggregate processing statistics
+        total_rounds += league_stats.get('total_rounds_processed', 0)
+        total_matches += league_stats.get('total_matches_analyzed', 0)
+        total_opportunities += league_stats.get('total_opportunities_created', 0)
+
+        logger.info(
+            f'Completed {country} - {league_name}',
+            rounds=league_stats.get('total_rounds_processed', 0),
+            matches=league_stats.get('total_matches_analyzed', 0),
+            opportunities=league_stats.get('total_opportunities_created', 0),
         )
 
+    # Get betting statistics once all leagues are done. They cover the whole
+    # season rather than one league, so per-league snapshots taken while other
+    # leagues are still running cannot be summed
     result = {
         'total_rounds_processed': total_rounds,
         'total_matches_analyzed': total_matches,
         'total_opportunities_created': total_opportunities,
-        'season_statistics': merged_stats.get('overall'),
-        'season_statistics_by_type': merged_stats.get('by_type'),
-        'season_statistics_by_rule': merged_stats.get('by_rule'),
-        'season_statistics_by_period': stats_by_period,
+        **await _get_betting_statistics(season=season),
         'leagues_processed': len(all_stats),
     }
 
@@ -613,53 +557,60 @@ async def main():
             rounds_back=args.rounds_back,
         )
 
-    print('\n=== Analysis Summary ===')
+    out: list[str] = []
+    out.append('\n=== Analysis Summary ===')
     if args.all_leagues:
-        print(f'Leagues processed: {stats.get("leagues_processed", 0)}')
-    print(f'Total rounds processed: {stats.get("total_rounds_processed", 0)}')
-    print(f'Total matches analyzed: {stats.get("total_matches_analyzed", 0)}')
-    print(f'Total opportunities created: {stats.get("total_opportunities_created", 0)}')
+        out.append(f'Leagues processed: {stats.get("leagues_processed", 0)}')
+    out.append(f'Total rounds processed: {stats.get("total_rounds_processed", 0)}')
+    out.append(f'Total matches analyzed: {stats.get("total_matches_analyzed", 0)}')
+    out.append(
+        f'Total opportunities created: {stats.get("total_opportunities_created", 0)}'
+    )
     if stats.get('updated_outcomes') is not None:
-        print(f'Updated outcomes: {stats.get("updated_outcomes", 0)}')
+        out.append(f'Updated outcomes: {stats.get("updated_outcomes", 0)}')
 
     # Display opportunities by round only for single league analysis
     if not args.all_leagues and stats.get('opportunities_by_round'):
-        print('\n=== Opportunities by Round ===')
+        out.append('\n=== Opportunities by Round ===')
         for round_num, count in sorted(stats.get('opportunities_by_round', {}).items()):
-            print(f'  Round {round_num}: {count} opportunities')
+            out.append(f'  Round {round_num}: {count} opportunities')
 
     # Display season statistics
     season_stats = stats.get('season_statistics')
     season_label = f'{args.season} Season' if args.season else 'All Seasons'
     if season_stats:
-        print(f'\n=== Betting Statistics for {season_label} ===')
-        print(f'Total opportunities: {season_stats["total"]}')
-        print(f'Wins: {season_stats["wins"]}')
-        print(f'Losses: {season_stats["losses"]}')
-        print(f'Win rate: {season_stats["win_rate"]}%')
+        out.append(f'\n=== Betting Statistics for {season_label} ===')
+        out.append(f'Total opportunities: {season_stats["total"]}')
+        out.append(f'Wins: {season_stats["wins"]}')
+        out.append(f'Losses: {season_stats["losses"]}')
+        out.append(f'Win rate: {season_stats["win_rate"]}%')
     else:
-        print(f'\n=== Betting Statistics for {season_label} ===')
-        print('Statistics not available')
+        out.append(f'\n=== Betting Statistics for {season_label} ===')
+        out.append('Statistics not available')
 
     # Display statistics by opportunity type
     stats_by_type = stats.get('season_statistics_by_type')
     if stats_by_type:
-        print(f'\n=== Betting Statistics by Opportunity Type for {season_label} ===')
+        out.append(
+            f'\n=== Betting Statistics by Opportunity Type for {season_label} ==='
+        )
         for opp_type, type_stats in sorted(stats_by_type.items()):
             opp_type_display = opp_type.replace('_', ' ').title()
-            print(f'\n{opp_type_display}:')
-            print(f'  Total opportunities: {type_stats["total"]}')
-            print(f'  Wins: {type_stats["wins"]}')
-            print(f'  Losses: {type_stats["losses"]}')
-            print(f'  Win rate: {type_stats["win_rate"]}%')
+            out.append(f'\n{opp_type_display}:')
+            out.append(f'  Total opportunities: {type_stats["total"]}')
+            out.append(f'  Wins: {type_stats["wins"]}')
+            out.append(f'  Losses: {type_stats["losses"]}')
+            out.append(f'  Win rate: {type_stats["win_rate"]}%')
     else:
-        print(f'\n=== Betting Statistics by Opportunity Type for {season_label} ===')
-        print('Statistics not available')
+        out.append(
+            f'\n=== Betting Statistics by Opportunity Type for {season_label} ==='
+        )
+        out.append('Statistics not available')
 
     # Display statistics by rule (to identify which rules are more efficient)
     stats_by_rule = stats.get('season_statistics_by_rule')
     if stats_by_rule:
-        print(f'\n=== Betting Statistics by Rule for {season_label} ===')
+        out.append(f'\n=== Betting Statistics by Rule for {season_label} ===')
         # Sort by win_rate descending to show most efficient rules first
         sorted_rules = sorted(
             stats_by_rule.items(),
@@ -668,19 +619,19 @@ async def main():
         )
         for rule_slug, rule_stats in sorted_rules:
             rule_name = rule_stats.get('rule_name', rule_slug)
-            print(f'\n{rule_name} ({rule_slug}):')
-            print(f'  Total opportunities: {rule_stats["total"]}')
-            print(f'  Wins: {rule_stats["wins"]}')
-            print(f'  Losses: {rule_stats["losses"]}')
-            print(f'  Win rate: {rule_stats["win_rate"]}%')
+            out.append(f'\n{rule_name} ({rule_slug}):')
+            out.append(f'  Total opportunities: {rule_stats["total"]}')
+            out.append(f'  Wins: {rule_stats["wins"]}')
+            out.append(f'  Losses: {rule_stats["losses"]}')
+            out.append(f'  Win rate: {rule_stats["win_rate"]}%')
     else:
-        print(f'\n=== Betting Statistics by Rule for {season_label} ===')
-        print('Statistics not available')
+        out.append(f'\n=== Betting Statistics by Rule for {season_label} ===')
+        out.append('Statistics not available')
 
     # Display statistics by season period (early/mid/late)
     stats_by_period = stats.get('season_statistics_by_period')
     if stats_by_period:
-        print(f'\n=== Betting Statistics by Season Period for {season_label} ===')
+        out.append(f'\n=== Betting Statistics by Season Period for {season_label} ===')
         period_names = {
             'early': 'Early Season (First Third)',
             'mid': 'Mid Season (Second Third)',
@@ -689,14 +640,16 @@ async def main():
         for period in ['early', 'mid', 'late']:
             period_stats = stats_by_period.get(period)
             if period_stats and period_stats['total'] > 0:
-                print(f'\n{period_names[period]}:')
-                print(f'  Total opportunities: {period_stats["total"]}')
-                print(f'  Wins: {period_stats["wins"]}')
-                print(f'  Losses: {period_stats["losses"]}')
-                print(f'  Win rate: {period_stats["win_rate"]}%')
+                out.append(f'\n{period_names[period]}:')
+                out.append(f'  Total opportunities: {period_stats["total"]}')
+                out.append(f'  Wins: {period_stats["wins"]}')
+                out.append(f'  Losses: {period_stats["losses"]}')
+                out.append(f'  Win rate: {period_stats["win_rate"]}%')
     else:
-        print(f'\n=== Betting Statistics by Season Period for {season_label} ===')
-        print('Statistics not available')
+        out.append(f'\n=== Betting Statistics by Season Period for {season_label} ===')
+        out.append('Statistics not available')
+
+    write_lines(out)
 
 
 if __name__ == '__main__':
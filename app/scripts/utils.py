@@ -0,0 +1,9 @@
+"""Utility functions shared by the analysis scripts."""
+
+import sys
+
+
+def write_lines(lines: list[str]) -> None:
+    """Write report lines to stdout in a single call and reset the buffer"""
+    sys.stdout.write('\n'.join(lines) + '\n')
+    lines.clear()
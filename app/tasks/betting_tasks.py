@@ -199,6 +199,7 @@ class BettingTasks:
         season: int = None,
         country: str = None,
         league_name: str = None,
+        scraper: LivesportScraper | None = None,
     ) -> str:
         """Refresh league standings and team statistics for a specific league.
 
@@ -207,6 +208,8 @@ class BettingTasks:
             season: Optional season year (e.g., 2024). If None, uses current season.
             country: Country name (e.g., 'England'). Required.
             league_name: League name (e.g., 'Premier League'). Required.
+            scraper: Optional already-started scraper to reuse. If None, a scraper
+                is started for this league only.
 
         Returns:
             Summary string with statistics about the refresh operation
@@ -230,12 +233,18 @@ class BettingTasks:
             try:
                 logger.info(f'Processing {country}: {league_name}')
 
-                # Use context manager for the league to minimize memory usage
-                async with LivesportScraper(scrape_coaches=False) as scraper:
-                    # Scrape and save league data iteratively
+                if scraper is not None:
+                    # Reuse the caller's browser across leagues
                     league_stats = await self._process_single_league(
                         scraper, country, league_name, season
                     )
+                else:
+                    # Use context manager for the league to minimize memory usage
+                    async with LivesportScraper(scrape_coaches=False) as scraper:
+                        # Scrape and save league data iteratively
+                        league_stats = await self._process_single_league(
+                            scraper, country, league_name, season
+                        )
 
                 total_standings = league_stats['standings_count']
                 total_matches = league_stats['matches_count']
@@ -305,11 +314,19 @@ class BettingTasks:
             league_repo = LeagueRepository(session)
             await league_repo.save_league(league_name, country)
 
-        # Scrape and save standings iteratively
+        # Scrape standings and matches concurrently
         try:
-            standings = await scraper.scrape_league_standings(
+            standings, matches = await scraper.scrape_league_all(
                 country, league_name, season
             )
+        except Exception as e:
+            logger.error(
+                f'Error scraping league data for {country}: {league_name}: {e}'
+            )
+            standings, matches = [], []
+
+        # Save standings iteratively
+        try:
             if standings:
                 # Save/update teams via repository
                 async with get_async_db_session() as session:
@@ -325,11 +342,10 @@ class BettingTasks:
                     f'Saved {len(standings)} team standings for {country} - {league_name}'
                 )
         except Exception as e:
-            logger.error(f'Error scraping standings for {country}: {league_name}: {e}')
+            logger.error(f'Error saving standings for {country}: {league_name}: {e}')
 
-        # Scrape and save matches iteratively
+        # Save matches iteratively
         try:
-            matches = await scraper.scrape_league_matches(country, league_name, season)
             if matches:
                 # Initialize repository for saving matches
                 async with get_async_db_session() as session:
@@ -341,7 +357,7 @@ class BettingTasks:
                     f'Saved {len(matches)} matches for {country} - {league_name}'
                 )
         except Exception as e:
-            logger.error(f'Error scraping matches for {country}: {league_name}: {e}')
+            logger.error(f'Error saving matches for {country}: {league_name}: {e}')
 
         # Scrape and save fixtures iteratively
         try:
@@ -474,8 +490,15 @@ async def refresh_league_data(
 
 async def refresh_all_leagues_data(ctx, season: int = None) -> None:
     """Refresh data for all leagues in LEAGUES_OF_INTEREST"""
-    for country, leagues in LEAGUES_OF_INTEREST.items():
-        for league in leagues:
-            await refresh_league_data(
-                ctx, season=season, country=country, league_name=league
-            )
+    tasks = BettingTasks()
+    # Launch the browser once and reuse it for every league
+    async with LivesportScraper(scrape_coaches=False) as scraper:
+        for country, leagues in LEAGUES_OF_INTEREST.items():
+            for league in leagues:
+                await tasks.refresh_league_data_task(
+                    ctx,
+                    season=season,
+                    country=country,
+                    league_name=league,
+                    scraper=scraper,
+                )
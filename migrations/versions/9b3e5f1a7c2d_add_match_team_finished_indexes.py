@@ -0,0 +1,41 @@
+"""add_match_team_finished_indexes
+
+Revision ID: 9b3e5f1a7c2d
+Revises: 48e52e03f0c5
+Create Date: 2026-10-17 10:12:04.318207
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9b3e5f1a7c2d'
+down_revision: Union[str, None] = '48e52e03f0c5'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    """Index finished matches by team, season and date.
+
+    Recent-match lookups filter on home_team_id OR away_team_id, so each side
+    gets its own partial index that SQLite can combine for the OR.
+    """
+    for side in ('home', 'away'):
+        op.create_index(
+            f'idx_match_{side}_team_finished',
+            'match',
+            [f'{side}_team_id', 'season', 'match_date'],
+            unique=False,
+            sqlite_where=sa.text("status = 'finished'"),
+            postgresql_where=sa.text("status = 'finished'"),
+        )
+
+
+def downgrade() -> None:
+    """Drop the finished-match team indexes."""
+    op.drop_index('idx_match_away_team_finished', table_name='match')
+    op.drop_index('idx_match_home_team_finished', table_name='match')